@@ -17,16 +17,8 @@ Examples:
     python main.py backtest 5d        # Backtest with 5-day data
 """
 
-import sys
-import os
-
-# Add src directory to Python path
-current_dir = os.path.dirname(os.path.abspath(__file__))
-src_dir = os.path.join(current_dir, 'src')
-sys.path.insert(0, src_dir)
-
 # Import and run the trading bot
-from trading_bot import main
+from src.trading_bot import main
 
 if __name__ == "__main__":
     main()
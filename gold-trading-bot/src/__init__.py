@@ -8,18 +8,20 @@ __author__ = "Gold Trading Bot AI"
 __description__ = "Advanced Python-based gold trading bot with technical analysis"
 
 # Package imports for easier access
-from config import Config
-from data_fetcher import DataFetcher
-from indicators import TechnicalIndicators
-from signal_generator import SignalGenerator
-from trading_bot import GoldTradingBot
-from cli import TradingBotCLI
+from .config import Config, CONFIG
+from .data_fetcher import DataFetcher
+from .indicators import TechnicalIndicators
+from .signal_generator import SignalGenerator, Signal
+from .trading_bot import GoldTradingBot
+from .cli import TradingBotCLI
 
 __all__ = [
     'Config',
+    'CONFIG',
     'DataFetcher', 
     'TechnicalIndicators',
     'SignalGenerator',
+    'Signal',
     'GoldTradingBot',
     'TradingBotCLI'
 ]
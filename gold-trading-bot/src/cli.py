@@ -1,38 +1,31 @@
 import os
 import sys
 from datetime import datetime
-from typing import Dict, Any
-from config import Config
-from data_fetcher import DataFetcher
-from signal_generator import SignalGenerator
+from typing import Dict, Any, List, Optional
+import pandas as pd
+from .config import Config, CONFIG
+from .data_fetcher import DataFetcher
+from .signal_generator import SignalGenerator, Signal
 
-class TradingBotCLI:
-    """Command Line Interface for the Gold Trading Bot"""
-    
-    def __init__(self, demo_mode: bool = False):
-        self.config = Config()
-        self.data_fetcher = DataFetcher(demo_mode=demo_mode)
-        self.signal_generator = SignalGenerator()
-        self.demo_mode = demo_mode
-    
-    def display_banner(self):
-        """Display welcome banner"""
-        banner = f"""
-{self.config.COLORS['INFO']}
+# Separator lines framing the signal analysis report, formatted with the color codes in use
+_REPORT_HEADER_OPEN = "\n{INFO}" + '=' * 80
+_REPORT_HEADER_CLOSE = '=' * 80 + "{RESET}"
+_REPORT_FOOTER = "{INFO}" + '=' * 80 + "{RESET}\n"
+
+# Banner and main menu, formatted once per CLI with the color codes in use
+_BANNER = """
+{INFO}
 ╔══════════════════════════════════════════════════════════════╗
 ║                    🏆 GOLD TRADING BOT AI 🏆                 ║
 ║                                                              ║
 ║           Advanced Technical Analysis for Gold Futures       ║
 ║                        (GC=F Analysis)                       ║
 ╚══════════════════════════════════════════════════════════════╝
-{self.config.COLORS['RESET']}
+{RESET}
 """
-        print(banner)
-    
-    def display_menu(self):
-        """Display main menu options"""
-        menu = f"""
-{self.config.COLORS['INFO']}📊 SELECT CHART TIMEFRAME:{self.config.COLORS['RESET']}
+
+_MENU = """
+{INFO}📊 SELECT CHART TIMEFRAME:{RESET}
 
 1️⃣  1-Day Chart    (5-minute candles)   - Short-term analysis
 2️⃣  2-Day Chart    (15-minute candles)  - Medium-term analysis  
@@ -42,20 +35,56 @@ class TradingBotCLI:
 6️⃣  Exit
 
 """
-        print(menu)
+
+# Main menu options accepted by get_user_choice
+_VALID_CHOICES = frozenset({'1', '2', '3', '4', '5', '6'})
+
+def write_lines(lines: List[str]) -> None:
+    """Write a block of lines to stdout with a single call"""
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+def terminal_colors() -> Dict[str, str]:
+    """Color codes by name; empty strings unless stdout is a terminal, so redirected output and logs stay plain"""
+    if sys.stdout.isatty():
+        return Config.COLORS
+    return dict.fromkeys(Config.COLORS, '')
+
+class TradingBotCLI:
+    """Command Line Interface for the Gold Trading Bot"""
+    
+    def __init__(self, demo_mode: bool = False):
+        self.config = CONFIG
+        self.data_fetcher = DataFetcher(demo_mode=demo_mode)
+        self.signal_generator = SignalGenerator()
+        self.demo_mode = demo_mode
+        
+        self._colors = terminal_colors()
+        self._banner = _BANNER.format(**self._colors)
+        self._menu = _MENU.format(**self._colors)
+        self._report_header_open = _REPORT_HEADER_OPEN.format(**self._colors)
+        self._report_header_close = _REPORT_HEADER_CLOSE.format(**self._colors)
+        self._report_footer = _REPORT_FOOTER.format(**self._colors)
+    
+    def display_banner(self):
+        """Display welcome banner"""
+        print(self._banner)
+    
+    def display_menu(self):
+        """Display main menu options"""
+        print(self._menu)
     
     def get_user_choice(self) -> str:
         """Get user menu selection"""
-        while True:
-            try:
-                choice = input(f"{self.config.COLORS['INFO']}Enter your choice (1-6): {self.config.COLORS['RESET']}").strip()
-                if choice in ['1', '2', '3', '4', '5', '6']:
+        prompt = f"{self._colors['INFO']}Enter your choice (1-6): {self._colors['RESET']}"
+        try:
+            while True:
+                choice = input(prompt).strip()
+                if choice in _VALID_CHOICES:
                     return choice
-                else:
-                    print(f"{self.config.COLORS['SELL']}❌ Invalid choice. Please enter 1-6.{self.config.COLORS['RESET']}")
-            except KeyboardInterrupt:
-                print(f"\n{self.config.COLORS['INFO']}👋 Goodbye!{self.config.COLORS['RESET']}")
-                sys.exit(0)
+                print(f"{self._colors['SELL']}❌ Invalid choice. Please enter 1-6.{self._colors['RESET']}")
+        except KeyboardInterrupt:
+            print(f"\n{self._colors['INFO']}👋 Goodbye!{self._colors['RESET']}")
+            sys.exit(0)
     
     def get_timeframe_from_choice(self, choice: str) -> str:
         """Convert menu choice to timeframe"""
@@ -66,133 +95,162 @@ class TradingBotCLI:
         }
         return timeframe_map.get(choice, '1d')
     
-    def display_signal_analysis(self, signal_data: Dict[str, Any]):
+    def display_signal_analysis(self, signal_data: Signal):
         """Display comprehensive signal analysis"""
-        if signal_data.get('signal') == 'ERROR':
-            self.display_error(signal_data.get('error', 'Unknown error'))
+        if signal_data.signal == 'ERROR':
+            self.display_error(signal_data.error or 'Unknown error')
             return
         
         # Header
-        print(f"\n{self.config.COLORS['INFO']}{'='*80}")
-        print(f"🔍 GOLD TRADING ANALYSIS - {signal_data['timestamp'].strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"{'='*80}{self.config.COLORS['RESET']}")
+        lines = [
+            self._report_header_open,
+            f"🔍 GOLD TRADING ANALYSIS - {signal_data.timestamp.strftime('%Y-%m-%d %H:%M:%S')}",
+            self._report_header_close
+        ]
         
         # Current Market Info
-        self.display_market_info(signal_data)
+        lines += self._market_info_lines(signal_data)
         
         # Main Signal
-        self.display_main_signal(signal_data)
+        lines += self._main_signal_lines(signal_data)
         
         # Technical Analysis Breakdown
-        self.display_technical_breakdown(signal_data)
+        lines += self._technical_breakdown_lines(signal_data)
         
         # Risk Management
-        self.display_risk_management(signal_data)
+        lines += self._risk_management_lines(signal_data)
         
         # Market Context
-        self.display_market_context(signal_data)
+        lines += self._market_context_lines(signal_data)
         
-        print(f"{self.config.COLORS['INFO']}{'='*80}{self.config.COLORS['RESET']}\n")
+        lines.append(self._report_footer)
+        write_lines(lines)
     
-    def display_market_info(self, signal_data: Dict[str, Any]):
+    def display_market_info(self, signal_data: Signal):
         """Display current market information"""
-        current_price = signal_data['current_price']
-        
-        print(f"\n{self.config.COLORS['INFO']}📈 CURRENT MARKET STATUS:{self.config.COLORS['RESET']}")
-        print(f"   Gold Price (GC=F): ${current_price:.2f}")
-        print(f"   Analysis Time: {signal_data['timestamp'].strftime('%H:%M:%S UTC')}")
+        write_lines(self._market_info_lines(signal_data))
     
-    def display_main_signal(self, signal_data: Dict[str, Any]):
+    def display_main_signal(self, signal_data: Signal):
         """Display main trading signal"""
-        signal = signal_data['signal']
-        strength = signal_data['signal_strength']
-        confidence = signal_data['confidence']
-        recommendation = signal_data['recommendation']
+        write_lines(self._main_signal_lines(signal_data))
+    
+    def display_technical_breakdown(self, signal_data: Signal):
+        """Display detailed technical analysis"""
+        write_lines(self._technical_breakdown_lines(signal_data))
+    
+    def display_risk_management(self, signal_data: Signal):
+        """Display risk management information"""
+        write_lines(self._risk_management_lines(signal_data))
+    
+    def display_market_context(self, signal_data: Signal):
+        """Display additional market context"""
+        write_lines(self._market_context_lines(signal_data))
+    
+    def _market_info_lines(self, signal_data: Signal) -> List[str]:
+        """Build the current market information lines"""
+        current_price = signal_data.current_price
+        
+        return [
+            f"\n{self._colors['INFO']}📈 CURRENT MARKET STATUS:{self._colors['RESET']}",
+            f"   Gold Price (GC=F): ${current_price:.2f}",
+            f"   Analysis Time: {signal_data.timestamp.strftime('%H:%M:%S UTC')}"
+        ]
+    
+    def _main_signal_lines(self, signal_data: Signal) -> List[str]:
+        """Build the main trading signal lines"""
+        signal = signal_data.signal
+        strength = signal_data.signal_strength
+        confidence = signal_data.confidence
+        recommendation = signal_data.recommendation
         
         # Choose color based on signal
         if signal == 'BUY':
-            color = self.config.COLORS['BUY']
+            color = self._colors['BUY']
             emoji = "🟢"
         elif signal == 'SELL':
-            color = self.config.COLORS['SELL']
+            color = self._colors['SELL']
             emoji = "🔴"
         else:
-            color = self.config.COLORS['HOLD']
+            color = self._colors['HOLD']
             emoji = "🟡"
         
-        print(f"\n{color}🎯 TRADING SIGNAL:{self.config.COLORS['RESET']}")
-        print(f"   {emoji} Signal: {color}{signal}{self.config.COLORS['RESET']}")
-        print(f"   📊 Strength: {strength:.1f}/10")
-        print(f"   🎯 Confidence: {confidence:.1f}/10")
-        print(f"   💡 Recommendation: {recommendation}")
+        return [
+            f"\n{color}🎯 TRADING SIGNAL:{self._colors['RESET']}",
+            f"   {emoji} Signal: {color}{signal}{self._colors['RESET']}",
+            f"   📊 Strength: {strength:.1f}/10",
+            f"   🎯 Confidence: {confidence:.1f}/10",
+            f"   💡 Recommendation: {recommendation}"
+        ]
     
-    def display_technical_breakdown(self, signal_data: Dict[str, Any]):
-        """Display detailed technical analysis"""
-        components = signal_data['components']
+    def _technical_breakdown_lines(self, signal_data: Signal) -> List[str]:
+        """Build the detailed technical analysis lines"""
+        components = signal_data.components
         
-        print(f"\n{self.config.COLORS['INFO']}🔧 TECHNICAL ANALYSIS BREAKDOWN:{self.config.COLORS['RESET']}")
+        lines = [f"\n{self._colors['INFO']}🔧 TECHNICAL ANALYSIS BREAKDOWN:{self._colors['RESET']}"]
         
         # EMA Analysis
         ema = components['ema']
-        print(f"   📈 EMA Analysis:")
-        print(f"      • Signal: {self._format_component_signal(ema['signal'])} (Strength: {ema['strength']:.1f})")
-        print(f"      • Trend: {ema['trend_direction']} (Strength: {ema['trend_strength']:.1f})")
-        for reason in ema['reasoning']:
-            print(f"      • {reason}")
+        lines.append(f"   📈 EMA Analysis:")
+        lines.append(f"      • Signal: {self._format_component_signal(ema['signal'])} (Strength: {ema['strength']:.1f})")
+        lines.append(f"      • Trend: {ema['trend_direction']} (Strength: {ema['trend_strength']:.1f})")
+        lines += [f"      • {reason}" for reason in ema['reasoning']]
         
         # RSI Analysis
         rsi = components['rsi']
-        print(f"   📊 RSI Analysis:")
-        print(f"      • Signal: {self._format_component_signal(rsi['signal'])} (Strength: {rsi['strength']:.1f})")
-        print(f"      • Current RSI: {rsi['current_rsi']:.1f} ({rsi['condition']})")
-        print(f"      • Momentum: {rsi['momentum']:+.1f}")
-        for reason in rsi['reasoning']:
-            print(f"      • {reason}")
+        lines.append(f"   📊 RSI Analysis:")
+        lines.append(f"      • Signal: {self._format_component_signal(rsi['signal'])} (Strength: {rsi['strength']:.1f})")
+        lines.append(f"      • Current RSI: {rsi['current_rsi']:.1f} ({rsi['condition']})")
+        lines.append(f"      • Momentum: {rsi['momentum']:+.1f}")
+        lines += [f"      • {reason}" for reason in rsi['reasoning']]
         
         # Volume Analysis
         volume = components['volume']
-        print(f"   📦 Volume Analysis:")
-        print(f"      • Volume Ratio: {volume['volume_ratio']:.1f}x average")
-        print(f"      • Status: {'HIGH VOLUME' if volume['is_high_volume'] else 'NORMAL VOLUME'}")
-        for reason in volume['reasoning']:
-            print(f"      • {reason}")
+        lines.append(f"   📦 Volume Analysis:")
+        lines.append(f"      • Volume Ratio: {volume['volume_ratio']:.1f}x average")
+        lines.append(f"      • Status: {'HIGH VOLUME' if volume['is_high_volume'] else 'NORMAL VOLUME'}")
+        lines += [f"      • {reason}" for reason in volume['reasoning']]
         
         # Trend Analysis
         trend = components['trend']
-        print(f"   📉 Support/Resistance:")
-        print(f"      • Support Level: ${trend['support_level']:.2f}")
-        print(f"      • Resistance Level: ${trend['resistance_level']:.2f}")
-        print(f"      • Trend Direction: {trend['trend_direction']}")
-        for reason in trend['reasoning']:
-            print(f"      • {reason}")
+        lines.append(f"   📉 Support/Resistance:")
+        lines.append(f"      • Support Level: ${trend['support_level']:.2f}")
+        lines.append(f"      • Resistance Level: ${trend['resistance_level']:.2f}")
+        lines.append(f"      • Trend Direction: {trend['trend_direction']}")
+        lines += [f"      • {reason}" for reason in trend['reasoning']]
+        
+        return lines
     
-    def display_risk_management(self, signal_data: Dict[str, Any]):
-        """Display risk management information"""
-        risk = signal_data['risk_management']
-        current_price = signal_data['current_price']
+    def _risk_management_lines(self, signal_data: Signal) -> List[str]:
+        """Build the risk management lines"""
+        risk = signal_data.risk_management
+        current_price = signal_data.current_price
         
-        print(f"\n{self.config.COLORS['SELL']}⚠️  RISK MANAGEMENT:{self.config.COLORS['RESET']}")
-        print(f"   🛑 Stop Loss: ${risk['stop_loss']:.2f} ({((risk['stop_loss'] - current_price) / current_price * 100):+.1f}%)")
-        print(f"   🎯 Take Profit: ${risk['take_profit']:.2f} ({((risk['take_profit'] - current_price) / current_price * 100):+.1f}%)")
-        print(f"   💰 Risk Amount: ${risk['risk_amount']:.2f}")
-        print(f"   🏆 Reward Amount: ${risk['reward_amount']:.2f}")
-        print(f"   ⚖️  Risk/Reward Ratio: 1:{risk['risk_reward_ratio']:.1f}")
-        print(f"   📏 ATR (Volatility): ${risk['atr_value']:.2f}")
+        return [
+            f"\n{self._colors['SELL']}⚠️  RISK MANAGEMENT:{self._colors['RESET']}",
+            f"   🛑 Stop Loss: ${risk['stop_loss']:.2f} ({((risk['stop_loss'] - current_price) / current_price * 100):+.1f}%)",
+            f"   🎯 Take Profit: ${risk['take_profit']:.2f} ({((risk['take_profit'] - current_price) / current_price * 100):+.1f}%)",
+            f"   💰 Risk Amount: ${risk['risk_amount']:.2f}",
+            f"   🏆 Reward Amount: ${risk['reward_amount']:.2f}",
+            f"   ⚖️  Risk/Reward Ratio: 1:{risk['risk_reward_ratio']:.1f}",
+            f"   📏 ATR (Volatility): ${risk['atr_value']:.2f}"
+        ]
     
-    def display_market_context(self, signal_data: Dict[str, Any]):
-        """Display additional market context"""
-        context = signal_data['market_context']
+    def _market_context_lines(self, signal_data: Signal) -> List[str]:
+        """Build the additional market context lines"""
+        context = signal_data.market_context
         
-        print(f"\n{self.config.COLORS['INFO']}🌍 MARKET CONTEXT:{self.config.COLORS['RESET']}")
-        print(f"   📈 Overall Trend: {context['trend_direction']} (Strength: {context['trend_strength']:.1f})")
-        print(f"   📊 RSI Condition: {context['rsi_condition']}")
-        print(f"   📦 Volume Status: {context['volume_status']}")
-        print(f"   🔻 Key Support: ${context['support_level']:.2f}")
-        print(f"   🔺 Key Resistance: ${context['resistance_level']:.2f}")
+        return [
+            f"\n{self._colors['INFO']}🌍 MARKET CONTEXT:{self._colors['RESET']}",
+            f"   📈 Overall Trend: {context['trend_direction']} (Strength: {context['trend_strength']:.1f})",
+            f"   📊 RSI Condition: {context['rsi_condition']}",
+            f"   📦 Volume Status: {context['volume_status']}",
+            f"   🔻 Key Support: ${context['support_level']:.2f}",
+            f"   🔺 Key Resistance: ${context['resistance_level']:.2f}"
+        ]
     
     def display_configuration(self):
         """Display current bot configuration"""
-        print(f"\n{self.config.COLORS['INFO']}⚙️  CURRENT CONFIGURATION:{self.config.COLORS['RESET']}")
+        print(f"\n{self._colors['INFO']}⚙️  CURRENT CONFIGURATION:{self._colors['RESET']}")
         print(f"   📊 Symbol: {self.config.DEFAULT_SYMBOL}")
         print(f"   🔑 Alpha Vantage API: {'✅ Configured' if self.config.ALPHA_VANTAGE_API_KEY else '❌ Not configured'}")
         print(f"   📈 EMA Periods: {self.config.EMA_SHORT_PERIOD}, {self.config.EMA_LONG_PERIOD}")
@@ -205,7 +263,7 @@ class TradingBotCLI:
     
     def display_custom_analysis_menu(self):
         """Display custom analysis options"""
-        print(f"\n{self.config.COLORS['INFO']}🔧 CUSTOM ANALYSIS OPTIONS:{self.config.COLORS['RESET']}")
+        print(f"\n{self._colors['INFO']}🔧 CUSTOM ANALYSIS OPTIONS:{self._colors['RESET']}")
         print("1️⃣  Multi-timeframe Analysis")
         print("2️⃣  Historical Backtest")
         print("3️⃣  Real-time Monitoring")
@@ -213,30 +271,31 @@ class TradingBotCLI:
     
     def display_error(self, error_message: str):
         """Display error message"""
-        print(f"\n{self.config.COLORS['SELL']}❌ ERROR: {error_message}{self.config.COLORS['RESET']}")
+        print(f"\n{self._colors['SELL']}❌ ERROR: {error_message}{self._colors['RESET']}")
     
     def display_loading(self, message: str):
         """Display loading message"""
-        print(f"{self.config.COLORS['INFO']}⏳ {message}...{self.config.COLORS['RESET']}")
+        print(f"{self._colors['INFO']}⏳ {message}...{self._colors['RESET']}")
     
     def _format_component_signal(self, signal: str) -> str:
         """Format component signal with color"""
         if signal == 'BUY':
-            return f"{self.config.COLORS['BUY']}{signal}{self.config.COLORS['RESET']}"
+            return f"{self._colors['BUY']}{signal}{self._colors['RESET']}"
         elif signal == 'SELL':
-            return f"{self.config.COLORS['SELL']}{signal}{self.config.COLORS['RESET']}"
+            return f"{self._colors['SELL']}{signal}{self._colors['RESET']}"
         else:
-            return f"{self.config.COLORS['HOLD']}{signal}{self.config.COLORS['RESET']}"
+            return f"{self._colors['HOLD']}{signal}{self._colors['RESET']}"
     
-    def run_analysis(self, timeframe: str):
-        """Run complete trading analysis"""
+    def run_analysis(self, timeframe: str, market_data: Optional[pd.DataFrame] = None):
+        """Run complete trading analysis, fetching market data unless it is provided"""
         try:
             # Display loading message
             timeframe_desc = self.config.TIMEFRAME_MAPPING[timeframe]['description']
             self.display_loading(f"Analyzing {timeframe_desc}")
             
             # Fetch market data
-            market_data = self.data_fetcher.get_market_data(timeframe)
+            if market_data is None:
+                market_data = self.data_fetcher.get_market_data(timeframe)
             
             if market_data is None:
                 self.display_error("Failed to fetch market data")
@@ -262,7 +321,7 @@ class TradingBotCLI:
         
         # Check API configuration
         if not self.config.ALPHA_VANTAGE_API_KEY:
-            print(f"{self.config.COLORS['HOLD']}⚠️  Alpha Vantage API key not configured. Using Yahoo Finance only.{self.config.COLORS['RESET']}")
+            print(f"{self._colors['HOLD']}⚠️  Alpha Vantage API key not configured. Using Yahoo Finance only.{self._colors['RESET']}")
             print(f"   To get better data quality, add your API key to .env file")
             print(f"   Get free API key at: https://www.alphavantage.co/support/#api-key\n")
         
@@ -275,31 +334,36 @@ class TradingBotCLI:
                 self.run_analysis(timeframe)
                 
                 # Ask if user wants to continue
-                print(f"\n{self.config.COLORS['INFO']}Press Enter to continue...{self.config.COLORS['RESET']}")
+                print(f"\n{self._colors['INFO']}Press Enter to continue...{self._colors['RESET']}")
                 input()
                 
             elif choice == '4':
                 self.display_custom_analysis_menu()
-                custom_choice = input(f"{self.config.COLORS['INFO']}Enter choice (1-4): {self.config.COLORS['RESET']}")
+                custom_choice = input(f"{self._colors['INFO']}Enter choice (1-4): {self._colors['RESET']}")
                 if custom_choice == '1':
-                    # Multi-timeframe analysis
-                    for tf in ['1d', '2d', '5d']:
-                        print(f"\n{self.config.COLORS['INFO']}--- {self.config.TIMEFRAME_MAPPING[tf]['description']} ---{self.config.COLORS['RESET']}")
-                        self.run_analysis(tf)
+                    # Multi-timeframe analysis (one fetch resampled for all timeframes)
+                    timeframes = ['1d', '2d', '5d']
+                    market_data = self.data_fetcher.get_multi_timeframe_data(timeframes)
+                    for tf in timeframes:
+                        print(f"\n{self._colors['INFO']}--- {self.config.TIMEFRAME_MAPPING[tf]['description']} ---{self._colors['RESET']}")
+                        if market_data[tf] is None:
+                            self.display_error("Failed to fetch market data")
+                            continue
+                        self.run_analysis(tf, market_data[tf])
                 elif custom_choice == '2':
-                    print(f"{self.config.COLORS['HOLD']}📊 Historical backtesting feature coming soon!{self.config.COLORS['RESET']}")
+                    print(f"{self._colors['HOLD']}📊 Historical backtesting feature coming soon!{self._colors['RESET']}")
                 elif custom_choice == '3':
-                    print(f"{self.config.COLORS['HOLD']}🔄 Real-time monitoring feature coming soon!{self.config.COLORS['RESET']}")
+                    print(f"{self._colors['HOLD']}🔄 Real-time monitoring feature coming soon!{self._colors['RESET']}")
                 
-                print(f"\n{self.config.COLORS['INFO']}Press Enter to continue...{self.config.COLORS['RESET']}")
+                print(f"\n{self._colors['INFO']}Press Enter to continue...{self._colors['RESET']}")
                 input()
                 
             elif choice == '5':
                 self.display_configuration()
-                print(f"\n{self.config.COLORS['INFO']}Press Enter to continue...{self.config.COLORS['RESET']}")
+                print(f"\n{self._colors['INFO']}Press Enter to continue...{self._colors['RESET']}")
                 input()
                 
             elif choice == '6':
-                print(f"\n{self.config.COLORS['BUY']}🏆 Thank you for using Gold Trading Bot AI!{self.config.COLORS['RESET']}")
-                print(f"{self.config.COLORS['INFO']}💡 Remember: This is for educational purposes. Always do your own research!{self.config.COLORS['RESET']}")
+                print(f"\n{self._colors['BUY']}🏆 Thank you for using Gold Trading Bot AI!{self._colors['RESET']}")
+                print(f"{self._colors['INFO']}💡 Remember: This is for educational purposes. Always do your own research!{self._colors['RESET']}")
                 break
@@ -0,0 +1,50 @@
+"""
+Ahead-of-time compilation of the indicator kernels
+
+Run once after installing the requirements:
+
+    python -m src.compile_kernels
+
+This builds the fast_indicators extension next to indicators.py. When it is
+present, indicators.py calls the precompiled exports and skips the JIT warmup
+on the first analysis; otherwise the njit kernels are used as before.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from .indicators import AOT_MODULE, _ema_adjust_false, _rsi_wilder, _atr_wilder, _compute_all
+
+def kernel_exports():
+    """(export name, signature, kernel) for every dtype combination the bot produces"""
+    exports = []
+    for price in ('f8', 'f4'):
+        exports.append((f'ema_adjust_false_{price}', f'{price}[:]({price}[:], f8)', _ema_adjust_false))
+        exports.append((f'rsi_wilder_{price}', f'Tuple(({price}[:], f8, f8))({price}[:], i8)', _rsi_wilder))
+        exports.append((f'atr_wilder_{price}_{price}_{price}',
+                        f'{price}[:]({price}[:], {price}[:], {price}[:], i8)', _atr_wilder))
+        
+        # Volume is int64 from Yahoo Finance and demo data, uint32 from the compact Alpha Vantage table
+        for volume in ('i8', 'u4'):
+            exports.append((
+                f'compute_all_{price}_{price}_{price}_{volume}',
+                f'Tuple(({price}[:], {price}[:], {price}[:], {price}[:], {price}[:], {price}[:], f8[:], f8, f8))'
+                f'({price}[:], {price}[:], {price}[:], {volume}[:], i8, i8, i8, i8, i8, i8)',
+                _compute_all
+            ))
+    return exports
+
+def main():
+    cc = CC(AOT_MODULE)
+    cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+    
+    for name, signature, kernel in kernel_exports():
+        cc.export(name, signature)(kernel.py_func)
+    
+    print(f"🔧 Compiling {AOT_MODULE} into {cc.output_dir}...")
+    cc.compile()
+    print("✅ Indicator kernels compiled")
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,14 @@
 import os
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+try:
+    from dotenv import load_dotenv
+except ImportError:  # python-dotenv is optional; variables can come from the environment
+    load_dotenv = None
+
+# Load environment variables once; child processes inherit them through os.environ
+if load_dotenv is not None and os.getenv('GOLDBOT_ENV_LOADED') != '1':
+    load_dotenv()
+    os.environ['GOLDBOT_ENV_LOADED'] = '1'
 
 class Config:
     """Configuration settings for the Gold Trading Bot"""
@@ -10,6 +16,7 @@ class Config:
     # API Configuration
     ALPHA_VANTAGE_API_KEY = os.getenv('PKU6TCDSOZ3CIDXKZ7NM', '')
     ALPHA_VANTAGE_BASE_URL = 'https://www.alphavantage.co/query'
+    ALPHA_VANTAGE_GRACE_PERIOD = 2.0  # Seconds Alpha Vantage gets before Yahoo Finance is also queried
     
     # Trading Configuration
     DEFAULT_SYMBOL = 'GLD'   # Gold ETF (more reliable than futures)
@@ -22,26 +29,57 @@ class Config:
             'yahoo_interval': '5m',
             'yahoo_period': '1d',
             'av_interval': '5min',
+            'cache_ttl': 60,
+            'resample_rule': '5min',
+            'bars': 78,
             'description': '1-day chart with 5-minute candles'
         },
         '2d': {
             'yahoo_interval': '15m',
             'yahoo_period': '2d',
             'av_interval': '15min',
+            'cache_ttl': 180,
+            'resample_rule': '15min',
+            'bars': 52,
             'description': '2-day chart with 15-minute candles'
         },
         '5d': {
             'yahoo_interval': '30m',
             'yahoo_period': '5d',
             'av_interval': '30min',
+            'cache_ttl': 300,
+            'resample_rule': '30min',
+            'bars': 65,
             'description': '5-day (weekly) chart with 30-minute candles'
+        },
+        # Finest candles over the longest window, fetched once and resampled for multi-timeframe analysis
+        '5d_5m': {
+            'yahoo_interval': '5m',
+            'yahoo_period': '5d',
+            'av_interval': '5min',
+            'cache_ttl': 60,
+            'resample_rule': '5min',
+            'bars': 390,
+            'description': '5-day chart with 5-minute candles'
         }
     }
     
+    # 'bars' above is the number of candles in the timeframe's regular trading sessions
+    MULTI_TIMEFRAME_SOURCE = '5d_5m'
+    
+    # Store fetched OHLC prices as float32 and volume as uint32 (set False to keep 64-bit data)
+    USE_FLOAT32 = True
+    
+    # Market Data Cache (cache_ttl above is in seconds)
+    CACHE_DIR = os.getenv('GOLDBOT_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'goldbot'))
+    
     # Technical Indicator Settings
     EMA_SHORT_PERIOD = 9
     EMA_LONG_PERIOD = 21
     RSI_PERIOD = 14
+    ATR_PERIOD = 14
+    SUPPORT_RESISTANCE_LOOKBACK = 20
+    VOLUME_PERIOD = 20
     RSI_OVERBOUGHT = 70
     RSI_OVERSOLD = 30
     
@@ -70,3 +108,13 @@ class Config:
         'INFO': '\033[94m',     # Blue
         'RESET': '\033[0m'      # Reset
     }
+    
+    # Color codes as plain attributes for the display code
+    BUY = COLORS['BUY']
+    SELL = COLORS['SELL']
+    HOLD = COLORS['HOLD']
+    INFO = COLORS['INFO']
+    RESET = COLORS['RESET']
+
+# Shared configuration instance used throughout the bot
+CONFIG = Config()
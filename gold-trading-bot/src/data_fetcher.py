@@ -1,20 +1,82 @@
-import yfinance as yf
-import requests
 import pandas as pd
 import numpy as np
+import io
+import os
+import asyncio
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime, timedelta
 import time
-from typing import Optional, Dict, Any
-from config import Config
-from demo_data import DemoDataGenerator
+from typing import Optional, Dict, Any, List
+from .config import CONFIG
+from .demo_data import DemoDataGenerator
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # The stdlib parser is slower but returns the same objects
+    import json
+    _json_loads = json.loads
+
+# Alpha Vantage CSV responses start with this header row
+AV_CSV_HEADER = 'timestamp,open,high,low,close,volume'
+AV_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# OHLCV column dtypes at full precision and in compact form (Config.USE_FLOAT32)
+OHLCV_DTYPES = {
+    'open': np.float64,
+    'high': np.float64,
+    'low': np.float64,
+    'close': np.float64,
+    'volume': np.int64
+}
+
+OHLCV_DTYPES_FLOAT32 = {
+    'open': np.float32,
+    'high': np.float32,
+    'low': np.float32,
+    'close': np.float32,
+    'volume': np.uint32
+}
+
+# Columns every OHLCV frame must provide for analysis
+REQUIRED_COLUMNS = frozenset(OHLCV_DTYPES)
+
+# How far back each timeframe reaches from the current time
+TIMEFRAME_LOOKBACK = {
+    '1d': timedelta(days=1),
+    '2d': timedelta(days=2),
+    '5d': timedelta(days=5),
+    '5d_5m': timedelta(days=5)
+}
+
+# How candles of one column combine when resampling to a coarser interval
+OHLCV_AGGREGATION = {
+    'open': 'first',
+    'high': 'max',
+    'low': 'min',
+    'close': 'last',
+    'volume': 'sum'
+}
+
+@lru_cache(maxsize=8)
+def _timeframe_cutoff(timeframe: str, minute: int) -> pd.Timestamp:
+    """Get the oldest timestamp inside a timeframe's window, computed once per wall-clock minute"""
+    return pd.Timestamp(datetime.fromtimestamp(minute * 60)) - TIMEFRAME_LOOKBACK[timeframe]
 
 class DataFetcher:
     """Handles data fetching from multiple sources with fallback support"""
     
     def __init__(self, demo_mode: bool = False):
-        self.config = Config()
+        self.config = CONFIG
         self.last_request_time = 0
         self.min_request_interval = 12  # 12 seconds between Alpha Vantage requests (5 per minute limit)
+        self._av_lock = None  # Serializes Alpha Vantage requests within the running event loop
+        self._av_lock_loop = None
+        self._session = None  # Created on first Alpha Vantage request
+        self._session_lock = threading.Lock()
         self.demo_mode = demo_mode
         self.demo_generator = DemoDataGenerator() if demo_mode else None
     
@@ -22,6 +84,32 @@ class DataFetcher:
         """
         Fetch market data with Alpha Vantage primary and Yahoo Finance fallback
         
+        Blocking wrapper around get_market_data_async for synchronous callers.
+        Inside a running event loop (e.g. Jupyter) the fetch runs its own loop
+        on a helper thread; async code should await get_market_data_async instead.
+        
+        Args:
+            timeframe: Chart timeframe ('1d', '2d', '5d')
+            
+        Returns:
+            DataFrame with OHLCV data or None if failed
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:  # No loop running in this thread
+            return asyncio.run(self.get_market_data_async(timeframe))
+        
+        # asyncio.run() cannot start a loop inside a running one
+        with ThreadPoolExecutor(max_workers=1) as runner:
+            return runner.submit(asyncio.run, self.get_market_data_async(timeframe)).result()
+    
+    async def get_market_data_async(self, timeframe: str = '1d') -> Optional[pd.DataFrame]:
+        """
+        Fetch market data with Alpha Vantage primary and Yahoo Finance fallback
+        
+        Network requests run on the fetcher's worker threads, so several
+        fetches can be awaited concurrently from one event loop.
+        
         Args:
             timeframe: Chart timeframe ('1d', '2d', '5d')
             
@@ -37,23 +125,15 @@ class DataFetcher:
             print(f"✅ Demo data generated successfully ({len(data)} data points)")
             return data
         
-        # Try Alpha Vantage first if API key is available
-        if self.config.ALPHA_VANTAGE_API_KEY:
-            print("🔄 Attempting Alpha Vantage data fetch...")
-            data = self._fetch_alpha_vantage_data(timeframe)
-            if data is not None:
-                print("✅ Alpha Vantage data fetch successful")
-                return data
-            else:
-                print("⚠️  Alpha Vantage failed, falling back to Yahoo Finance...")
-        else:
-            print("⚠️  No Alpha Vantage API key, using Yahoo Finance...")
+        # Reuse recently fetched data while it is still fresh
+        data = self._load_cached_data(timeframe)
+        if data is not None:
+            return data
         
-        # Fallback to Yahoo Finance
-        print("🔄 Fetching from Yahoo Finance...")
-        data = self._fetch_yahoo_data(timeframe)
+        # Race the available sources and keep the first successful result
+        data = await self._fetch_first_available(timeframe)
         if data is not None:
-            print("✅ Yahoo Finance data fetch successful")
+            self._save_cached_data(timeframe, data)
             return data
         else:
             print("❌ Both data sources failed, switching to demo mode...")
@@ -63,16 +143,220 @@ class DataFetcher:
             print(f"✅ Demo data generated successfully ({len(data)} data points)")
             return data
     
-    def _fetch_alpha_vantage_data(self, timeframe: str) -> Optional[pd.DataFrame]:
-        """Fetch data from Alpha Vantage API"""
-        try:
-            # Rate limiting
-            current_time = time.time()
-            if current_time - self.last_request_time < self.min_request_interval:
-                wait_time = self.min_request_interval - (current_time - self.last_request_time)
-                print(f"⏳ Rate limiting: waiting {wait_time:.1f} seconds...")
-                time.sleep(wait_time)
+    def get_multi_timeframe_data(self, timeframes: List[str]) -> Dict[str, Optional[pd.DataFrame]]:
+        """
+        Fetch market data for several timeframes with a single request
+        
+        The finest candles over the longest window (Config.MULTI_TIMEFRAME_SOURCE)
+        are fetched once, then resampled to each timeframe's candle interval and
+        cut to its number of bars.
+        
+        Args:
+            timeframes: Chart timeframes to derive (e.g. ['1d', '2d', '5d'])
+            
+        Returns:
+            Dictionary mapping each timeframe to its DataFrame (or None if failed)
+        """
+        source_timeframe = self.config.MULTI_TIMEFRAME_SOURCE
+        source = self.get_market_data(source_timeframe)
+        if source is None:
+            return dict.fromkeys(timeframes)
+        
+        source_rule = self.config.TIMEFRAME_MAPPING[source_timeframe]['resample_rule']
+        results = {}
+        for timeframe in timeframes:
+            mapping = self.config.TIMEFRAME_MAPPING[timeframe]
+            data = source if mapping['resample_rule'] == source_rule else self._resample(source, mapping['resample_rule'])
+            results[timeframe] = data.iloc[-mapping['bars']:]
+        
+        return results
+    
+    async def _fetch_first_available(self, timeframe: str) -> Optional[pd.DataFrame]:
+        """
+        Fetch from Alpha Vantage and Yahoo Finance concurrently
+        
+        When an Alpha Vantage key is configured, Yahoo Finance starts after a
+        short grace period (or as soon as Alpha Vantage fails), so Alpha Vantage
+        data is preferred when it responds quickly, while a slow request no
+        longer delays the fallback by its full timeout.
+        
+        Args:
+            timeframe: Chart timeframe ('1d', '2d', '5d')
             
+        Returns:
+            DataFrame from the first source that succeeded, or None if both failed
+        """
+        sources = {}
+        av_task = None
+        
+        if self.config.ALPHA_VANTAGE_API_KEY:
+            print("🔄 Attempting Alpha Vantage data fetch...")
+            av_task = asyncio.ensure_future(self._fetch_alpha_vantage_async(timeframe))
+            sources[av_task] = 'Alpha Vantage'
+        else:
+            print("⚠️  No Alpha Vantage API key, using Yahoo Finance...")
+        
+        yahoo_task = asyncio.ensure_future(self._fetch_yahoo_after(av_task, timeframe))
+        sources[yahoo_task] = 'Yahoo Finance'
+        
+        pending = set(sources)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                data = task.result()
+                if data is not None:
+                    # Stop waiting for the slower source
+                    for other in pending:
+                        other.cancel()
+                    print(f"✅ {sources[task]} data fetch successful")
+                    return data
+                print(f"⚠️  {sources[task]} failed")
+        
+        return None
+    
+    async def _fetch_alpha_vantage_async(self, timeframe: str) -> Optional[pd.DataFrame]:
+        """Fetch from Alpha Vantage once the rate limit allows another request"""
+        async with self._get_av_lock():
+            elapsed = time.monotonic() - self.last_request_time
+            if elapsed < self.min_request_interval:
+                wait_time = self.min_request_interval - elapsed
+                print(f"⏳ Rate limiting: waiting {wait_time:.1f} seconds...")
+                # Yields to the event loop so other fetches keep running meanwhile
+                await asyncio.sleep(wait_time)
+            self.last_request_time = time.monotonic()
+        
+        return await self._run_blocking(self._fetch_alpha_vantage_data, timeframe)
+    
+    def _get_av_lock(self) -> asyncio.Lock:
+        """Get the Alpha Vantage rate limit lock for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._av_lock_loop is not loop:
+            # asyncio locks cannot be shared between the loops of separate asyncio.run() calls
+            self._av_lock = asyncio.Lock()
+            self._av_lock_loop = loop
+        return self._av_lock
+    
+    async def _fetch_yahoo_after(self, preferred: Optional[asyncio.Future], timeframe: str) -> Optional[pd.DataFrame]:
+        """Start a Yahoo Finance fetch once the preferred fetch finished or its grace period ran out"""
+        if preferred is not None:
+            await asyncio.wait({preferred}, timeout=self.config.ALPHA_VANTAGE_GRACE_PERIOD)
+        print("🔄 Fetching from Yahoo Finance...")
+        return await self._run_blocking(self._fetch_yahoo_data, timeframe)
+    
+    async def _run_blocking(self, fetch, timeframe: str) -> Optional[pd.DataFrame]:
+        """
+        Run a blocking fetch on a daemon thread without blocking the event loop
+        
+        A cancelled fetch (the slower source of a decided race) cannot be
+        interrupted, so it is marked abandoned to silence its messages, and the
+        daemon thread keeps it from delaying interpreter exit.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        abandoned = threading.Event()
+        
+        def deliver(result):
+            if not future.done():
+                future.set_result(result)
+        
+        def run():
+            result = None  # The fetchers report their own errors and return None
+            try:
+                result = fetch(timeframe, abandoned)
+            finally:
+                try:
+                    loop.call_soon_threadsafe(deliver, result)
+                except RuntimeError:  # The loop already closed; nobody waits for this result
+                    pass
+        
+        threading.Thread(target=run, name='goldbot-fetch', daemon=True).start()
+        try:
+            return await future
+        except asyncio.CancelledError:
+            abandoned.set()
+            raise
+    
+    @staticmethod
+    def _report(abandoned: threading.Event, message: str):
+        """Print a fetch message unless the fetch was abandoned"""
+        if not abandoned.is_set():
+            print(message)
+    
+    def _cache_path(self, timeframe: str) -> str:
+        """Get the cache file path for a timeframe's (symbol, interval, period)"""
+        mapping = self.config.TIMEFRAME_MAPPING[timeframe]
+        filename = f"{self.config.YAHOO_SYMBOL}_{mapping['yahoo_interval']}_{mapping['yahoo_period']}.npz"
+        return os.path.join(self.config.CACHE_DIR, filename)
+    
+    def _load_cached_data(self, timeframe: str) -> Optional[pd.DataFrame]:
+        """Load cached market data if it is younger than the timeframe's TTL"""
+        path = self._cache_path(timeframe)
+        try:
+            age = time.time() - os.path.getmtime(path)
+            if age >= self.config.TIMEFRAME_MAPPING[timeframe]['cache_ttl']:
+                return None
+            data = self._read_cache_file(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile) as e:
+            print(f"⚠️  Ignoring unreadable market data cache: {str(e)}")
+            return None
+        
+        print(f"⚡ Using cached market data ({age:.0f}s old, {len(data)} data points)")
+        return data
+    
+    def _save_cached_data(self, timeframe: str, df: pd.DataFrame):
+        """Write freshly fetched market data to the on-disk cache"""
+        path = self._cache_path(timeframe)
+        try:
+            os.makedirs(self.config.CACHE_DIR, exist_ok=True)
+            # Write to a temporary file first so readers never see a partial file
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            self._write_cache_file(tmp_path, df)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️  Could not write market data cache: {str(e)}")
+    
+    @staticmethod
+    def _write_cache_file(path: str, df: pd.DataFrame):
+        """Store the OHLCV columns and UTC nanosecond timestamps as plain arrays (no pickled objects)"""
+        index = pd.DatetimeIndex(df.index)
+        arrays = {column: df[column].to_numpy() for column in OHLCV_DTYPES}
+        with open(path, 'wb') as f:
+            np.savez(f, timestamp=index.asi8, tz=np.array(str(index.tz or '')), **arrays)
+    
+    @staticmethod
+    def _read_cache_file(path: str) -> pd.DataFrame:
+        """Read a frame written by _write_cache_file; never unpickles file contents"""
+        with np.load(path, allow_pickle=False) as archive:
+            index = pd.DatetimeIndex(archive['timestamp'].view('datetime64[ns]'), name='timestamp')
+            tz = str(archive['tz'])
+            if tz:
+                index = index.tz_localize('UTC').tz_convert(tz)
+            return pd.DataFrame({column: archive[column] for column in OHLCV_DTYPES}, index=index)
+    
+    def _get_session(self):
+        """Get the HTTP session that keeps Alpha Vantage connections alive, creating it on first use"""
+        with self._session_lock:
+            if self._session is None:
+                # Imported here so startup does not pay for requests until data is fetched
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+                
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=2,
+                    pool_maxsize=4,
+                    max_retries=Retry(total=2, backoff_factor=0.3)
+                )
+                session.mount('https://', adapter)
+                self._session = session
+            return self._session
+    
+    def _fetch_alpha_vantage_data(self, timeframe: str, abandoned: threading.Event) -> Optional[pd.DataFrame]:
+        """Fetch data from Alpha Vantage API (callers are responsible for rate limiting)"""
+        try:
             # Get interval from config
             interval = self.config.TIMEFRAME_MAPPING[timeframe]['av_interval']
             
@@ -82,63 +366,61 @@ class DataFetcher:
                 'symbol': self.config.AV_SYMBOL,
                 'interval': interval,
                 'apikey': self.config.ALPHA_VANTAGE_API_KEY,
-                'outputsize': 'full'
+                'outputsize': 'full',
+                'datatype': 'csv'
             }
             
-            response = requests.get(self.config.ALPHA_VANTAGE_BASE_URL, params=params, timeout=30)
-            self.last_request_time = time.time()
+            response = self._get_session().get(self.config.ALPHA_VANTAGE_BASE_URL, params=params, timeout=30)
             
             if response.status_code != 200:
-                print(f"❌ Alpha Vantage API error: {response.status_code}")
+                self._report(abandoned, f"❌ Alpha Vantage API error: {response.status_code}")
                 return None
             
-            data = response.json()
+            body = response.text
             
-            # Check for API errors
-            if 'Error Message' in data:
-                print(f"❌ Alpha Vantage error: {data['Error Message']}")
+            # Errors and rate limit notices are still returned as JSON
+            if not body.startswith(AV_CSV_HEADER):
+                self._report_alpha_vantage_error(body, abandoned)
                 return None
             
-            if 'Note' in data:
-                print(f"⚠️  Alpha Vantage rate limit: {data['Note']}")
-                return None
-            
-            # Extract time series data
-            time_series_key = f'Time Series ({interval})'
-            if time_series_key not in data:
-                print(f"❌ No time series data found in Alpha Vantage response")
-                return None
-            
-            time_series = data[time_series_key]
-            
-            # Convert to DataFrame
-            df_data = []
-            for timestamp, values in time_series.items():
-                df_data.append({
-                    'timestamp': pd.to_datetime(timestamp),
-                    'open': float(values['1. open']),
-                    'high': float(values['2. high']),
-                    'low': float(values['3. low']),
-                    'close': float(values['4. close']),
-                    'volume': int(values['5. volume'])
-                })
-            
-            df = pd.DataFrame(df_data)
-            df.set_index('timestamp', inplace=True)
+            # Parse the CSV body straight into the final column dtypes
+            df = pd.read_csv(
+                io.StringIO(body),
+                index_col='timestamp',
+                dtype=OHLCV_DTYPES_FLOAT32 if self.config.USE_FLOAT32 else OHLCV_DTYPES
+            )
+            # A fixed format skips pandas' per-call format inference
+            df.index = pd.to_datetime(df.index, format=AV_TIMESTAMP_FORMAT, cache=True)
             df.sort_index(inplace=True)
             
             # Filter data based on timeframe
-            df = self._filter_by_timeframe(df, timeframe)
-            
-            return df
+            return self._filter_by_timeframe(df, timeframe)
             
         except Exception as e:
-            print(f"❌ Alpha Vantage fetch error: {str(e)}")
+            self._report(abandoned, f"❌ Alpha Vantage fetch error: {str(e)}")
             return None
     
-    def _fetch_yahoo_data(self, timeframe: str) -> Optional[pd.DataFrame]:
+    def _report_alpha_vantage_error(self, body: str, abandoned: threading.Event):
+        """Print the reason an Alpha Vantage response contained no CSV data"""
+        try:
+            data = _json_loads(body) if body.lstrip().startswith('{') else {}
+        except ValueError:
+            data = {}
+        
+        if 'Error Message' in data:
+            self._report(abandoned, f"❌ Alpha Vantage error: {data['Error Message']}")
+        elif 'Note' in data:
+            self._report(abandoned, f"⚠️  Alpha Vantage rate limit: {data['Note']}")
+        elif 'Information' in data:
+            self._report(abandoned, f"⚠️  Alpha Vantage notice: {data['Information']}")
+        else:
+            self._report(abandoned, f"❌ No time series data found in Alpha Vantage response")
+    
+    def _fetch_yahoo_data(self, timeframe: str, abandoned: threading.Event) -> Optional[pd.DataFrame]:
         """Fetch data from Yahoo Finance"""
         try:
+            import yfinance as yf
+            
             # Get parameters from config
             interval = self.config.TIMEFRAME_MAPPING[timeframe]['yahoo_interval']
             period = self.config.TIMEFRAME_MAPPING[timeframe]['yahoo_period']
@@ -150,7 +432,7 @@ class DataFetcher:
             data = ticker.history(period=period, interval=interval)
             
             if data.empty:
-                print("❌ No data received from Yahoo Finance")
+                self._report(abandoned, "❌ No data received from Yahoo Finance")
                 return None
             
             # Standardize column names
@@ -170,32 +452,43 @@ class DataFetcher:
             data.rename(columns=column_mapping, inplace=True)
             data.set_index('timestamp', inplace=True)
             
-            return data
+            return self._downcast(data)
             
         except Exception as e:
-            print(f"❌ Yahoo Finance fetch error: {str(e)}")
+            self._report(abandoned, f"❌ Yahoo Finance fetch error: {str(e)}")
             return None
     
+    def _downcast(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Shrink OHLC prices to float32 and volume to uint32 to halve memory traffic downstream"""
+        if not self.config.USE_FLOAT32:
+            return df
+        
+        return df.astype(OHLCV_DTYPES_FLOAT32)
+    
+    def _resample(self, df: pd.DataFrame, rule: str) -> pd.DataFrame:
+        """Combine candles into coarser ones, dropping intervals without trades"""
+        resampled = df.resample(rule).agg(OHLCV_AGGREGATION).dropna(subset=['close'])
+        return resampled.astype(df.dtypes[list(OHLCV_AGGREGATION)].to_dict())
+    
     def _filter_by_timeframe(self, df: pd.DataFrame, timeframe: str) -> pd.DataFrame:
         """Filter DataFrame based on timeframe"""
-        if timeframe == '1d':
-            cutoff = datetime.now() - timedelta(days=1)
-        elif timeframe == '2d':
-            cutoff = datetime.now() - timedelta(days=2)
-        elif timeframe == '5d':
-            cutoff = datetime.now() - timedelta(days=5)
-        else:
+        if timeframe not in TIMEFRAME_LOOKBACK:
             return df
         
-        return df[df.index >= cutoff]
+        # The index is sorted, so a binary search finds the first bar inside the window
+        cutoff = _timeframe_cutoff(timeframe, int(time.time() // 60))
+        start = df.index.searchsorted(cutoff, side='left')
+        return df.iloc[start:]
     
     def get_current_price(self) -> Optional[float]:
         """Get current gold price"""
         try:
+            import yfinance as yf
+            
             ticker = yf.Ticker(self.config.YAHOO_SYMBOL)
             data = ticker.history(period='1d', interval='1m')
             if not data.empty:
-                return float(data['Close'].iloc[-1])
+                return float(data['Close'].iat[-1])
             return None
         except Exception as e:
             print(f"❌ Error fetching current price: {str(e)}")
@@ -206,13 +499,13 @@ class DataFetcher:
         if df is None or df.empty:
             return False
         
-        required_columns = ['open', 'high', 'low', 'close', 'volume']
-        if not all(col in df.columns for col in required_columns):
+        if not REQUIRED_COLUMNS.issubset(df.columns):
             print(f"❌ Missing required columns. Found: {list(df.columns)}")
             return False
         
-        if len(df) < 50:  # Need at least 50 data points for reliable indicators
-            print(f"❌ Insufficient data points: {len(df)} (minimum 50 required)")
+        num_rows = df.shape[0]
+        if num_rows < 50:  # Need at least 50 data points for reliable indicators
+            print(f"❌ Insufficient data points: {num_rows} (minimum 50 required)")
             return False
         
         return True
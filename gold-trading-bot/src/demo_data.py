@@ -1,91 +1,80 @@
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+from .config import CONFIG
+
+# Demo bar interval for each chart timeframe
+DEMO_INTERVALS = {'1d': '5min', '2d': '15min', '5d': '30min', '5d_5m': '5min'}
+
+# The multi-timeframe source needs enough 5-minute bars to resample 100 30-minute candles
+DEMO_POINTS = {'5d_5m': 600}
 
 class DemoDataGenerator:
     """Generate realistic demo data for testing the trading bot"""
     
-    def __init__(self):
+    def __init__(self, seed: int = 42):
         self.base_price = 200.0  # Base price for GLD ETF
+        self.seed = seed
+        self._rng = np.random.default_rng(seed)
         
-    def generate_demo_data(self, timeframe: str = '1d', num_points: int = 100) -> pd.DataFrame:
+    def generate_demo_data(self, timeframe: str = '1d', num_points: Optional[int] = None) -> pd.DataFrame:
         """
         Generate realistic OHLCV data for demo purposes
         
         Args:
             timeframe: Chart timeframe ('1d', '2d', '5d')
-            num_points: Number of data points to generate
+            num_points: Number of data points to generate (default depends on the timeframe)
             
         Returns:
             DataFrame with OHLCV data
         """
-        # Set intervals based on timeframe
-        if timeframe == '1d':
-            interval_minutes = 5
-            start_time = datetime.now() - timedelta(days=1)
-        elif timeframe == '2d':
-            interval_minutes = 15
-            start_time = datetime.now() - timedelta(days=2)
-        else:  # 5d
-            interval_minutes = 30
-            start_time = datetime.now() - timedelta(days=5)
+        if num_points is None:
+            num_points = DEMO_POINTS.get(timeframe, 100)
         
-        # Generate timestamps
-        timestamps = []
-        current_time = start_time
-        for i in range(num_points):
-            timestamps.append(current_time)
-            current_time += timedelta(minutes=interval_minutes)
+        # Generate timestamps ending now at the timeframe's bar interval
+        timestamps = pd.date_range(end=pd.Timestamp.now(), periods=num_points,
+                                   freq=DEMO_INTERVALS.get(timeframe, '30min'), name='timestamp')
         
         # Generate realistic price data with trends and volatility
-        np.random.seed(42)  # For reproducible demo data
+        rng = np.random.default_rng(self.seed)  # For reproducible demo data
         
         # Create a trending price series
         trend = np.linspace(0, 5, num_points)  # Slight upward trend
-        noise = np.random.normal(0, 2, num_points)  # Random volatility
+        noise = rng.normal(0, 2, num_points)  # Random volatility
         cyclical = 3 * np.sin(np.linspace(0, 4*np.pi, num_points))  # Cyclical pattern
         
         # Generate close prices
         close_prices = self.base_price + trend + noise + cyclical
         
-        # Generate OHLC data
-        data = []
-        for i, (timestamp, close) in enumerate(zip(timestamps, close_prices)):
-            # Generate realistic OHLC based on close price
-            volatility = np.random.uniform(0.5, 2.0)
-            
-            high = close + np.random.uniform(0, volatility)
-            low = close - np.random.uniform(0, volatility)
-            
-            if i == 0:
-                open_price = close + np.random.uniform(-0.5, 0.5)
-            else:
-                # Open close to previous close
-                open_price = close_prices[i-1] + np.random.uniform(-0.3, 0.3)
-            
-            # Ensure OHLC relationships are correct
-            high = max(high, open_price, close)
-            low = min(low, open_price, close)
-            
-            # Generate volume (higher volume on bigger price moves)
-            price_change = abs(close - (close_prices[i-1] if i > 0 else close))
-            base_volume = np.random.uniform(1000000, 3000000)
-            volume_multiplier = 1 + (price_change / close) * 10
-            volume = int(base_volume * volume_multiplier)
-            
-            data.append({
-                'timestamp': timestamp,
-                'open': round(open_price, 2),
-                'high': round(high, 2),
-                'low': round(low, 2),
-                'close': round(close, 2),
-                'volume': volume
-            })
-        
-        # Create DataFrame
-        df = pd.DataFrame(data)
-        df.set_index('timestamp', inplace=True)
+        # Generate OHLC data around the close prices in one batch
+        volatility = rng.uniform(0.5, 2.0, num_points)
+        high_offsets = rng.uniform(0, volatility)
+        low_offsets = rng.uniform(0, volatility)
+        open_offsets = rng.uniform(-0.3, 0.3, num_points)
+        
+        # Open close to previous close
+        open_prices = np.empty(num_points)
+        open_prices[0] = close_prices[0] + rng.uniform(-0.5, 0.5)
+        open_prices[1:] = close_prices[:-1] + open_offsets[1:]
+        
+        # Ensure OHLC relationships are correct
+        high_prices = np.maximum(close_prices + high_offsets, open_prices)
+        low_prices = np.minimum(close_prices - low_offsets, open_prices)
+        
+        # Generate volume (higher volume on bigger price moves)
+        price_change = np.abs(np.diff(close_prices, prepend=close_prices[0]))
+        base_volume = rng.uniform(1000000, 3000000, num_points)
+        volume = (base_volume * (1 + (price_change / close_prices) * 10)).astype(np.int64)
+        
+        # Create DataFrame (float32 prices unless full precision is configured)
+        price_dtype = np.float32 if CONFIG.USE_FLOAT32 else np.float64
+        df = pd.DataFrame({
+            'open': open_prices.astype(price_dtype, copy=False),
+            'high': high_prices.astype(price_dtype, copy=False),
+            'low': low_prices.astype(price_dtype, copy=False),
+            'close': close_prices.astype(price_dtype, copy=False),
+            'volume': volume
+        }, index=timestamps)
         
         return df
     
@@ -105,48 +94,45 @@ class DemoDataGenerator:
         if direction == 'bullish':
             # Strong upward trend with EMA crossover
             trend = np.linspace(0, 15, num_points)
-            noise = np.random.normal(0, 1, num_points)
+            noise = self._rng.normal(0, 1, num_points)
         elif direction == 'bearish':
             # Strong downward trend
             trend = np.linspace(0, -15, num_points)
-            noise = np.random.normal(0, 1, num_points)
+            noise = self._rng.normal(0, 1, num_points)
         else:  # sideways
             # Sideways movement
-            trend = np.random.normal(0, 0.5, num_points)
-            noise = np.random.normal(0, 2, num_points)
+            trend = self._rng.normal(0, 0.5, num_points)
+            noise = self._rng.normal(0, 2, num_points)
         
         # Generate timestamps
-        start_time = datetime.now() - timedelta(days=1)
-        timestamps = [start_time + timedelta(minutes=5*i) for i in range(num_points)]
+        timestamps = pd.date_range(end=pd.Timestamp.now(), periods=num_points, freq='5min', name='timestamp')
         
         # Generate close prices
         close_prices = self.base_price + trend + noise
         
-        # Generate OHLCV data
-        data = []
-        for i, (timestamp, close) in enumerate(zip(timestamps, close_prices)):
-            volatility = np.random.uniform(0.3, 1.0)
-            
-            high = close + np.random.uniform(0, volatility)
-            low = close - np.random.uniform(0, volatility)
-            open_price = close_prices[i-1] + np.random.uniform(-0.2, 0.2) if i > 0 else close
-            
-            high = max(high, open_price, close)
-            low = min(low, open_price, close)
-            
-            volume = np.random.randint(1000000, 4000000)
-            
-            data.append({
-                'timestamp': timestamp,
-                'open': round(open_price, 2),
-                'high': round(high, 2),
-                'low': round(low, 2),
-                'close': round(close, 2),
-                'volume': volume
-            })
-        
-        df = pd.DataFrame(data)
-        df.set_index('timestamp', inplace=True)
+        # Generate OHLCV data in one batch
+        volatility = self._rng.uniform(0.3, 1.0, num_points)
+        high_offsets = self._rng.uniform(0, volatility)
+        low_offsets = self._rng.uniform(0, volatility)
+        open_offsets = self._rng.uniform(-0.2, 0.2, num_points)
+        
+        open_prices = np.empty(num_points)
+        open_prices[0] = close_prices[0]
+        open_prices[1:] = close_prices[:-1] + open_offsets[1:]
+        
+        high_prices = np.maximum(close_prices + high_offsets, open_prices)
+        low_prices = np.minimum(close_prices - low_offsets, open_prices)
+        
+        volume = self._rng.integers(1000000, 4000000, num_points)
+        
+        price_dtype = np.float32 if CONFIG.USE_FLOAT32 else np.float64
+        df = pd.DataFrame({
+            'open': open_prices.astype(price_dtype, copy=False),
+            'high': high_prices.astype(price_dtype, copy=False),
+            'low': low_prices.astype(price_dtype, copy=False),
+            'close': close_prices.astype(price_dtype, copy=False),
+            'volume': volume
+        }, index=timestamps)
         
         return df
     
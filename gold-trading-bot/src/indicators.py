@@ -1,66 +1,403 @@
+import importlib
 import pandas as pd
 import numpy as np
-from typing import Tuple, Dict, Any
-from config import Config
+from collections import deque
+from functools import lru_cache
+from typing import Tuple, Dict, Any, Mapping, Optional, Union
+from .config import CONFIG
+from .numba_compat import njit, NUMBA_AVAILABLE
+
+try:
+    import bottleneck as bn
+    _window_max, _window_min, _window_mean = bn.nanmax, bn.nanmin, bn.nanmean
+except ImportError:  # NumPy's reductions give the same results with more per-call overhead
+    _window_max, _window_min, _window_mean = np.nanmax, np.nanmin, np.nanmean
+
+# Number of calculate_all_indicators results kept per TechnicalIndicators instance
+INDICATOR_CACHE_SIZE = 8
+
+# Minimum number of bars the one-bar update reserves when its series buffers are full
+SERIES_GROWTH = 64
+
+# OHLCV bars: a DataFrame indexed by time, or a mapping of column arrays plus the
+# 'timestamp' DatetimeIndex (or datetime64 array)
+Bars = Union[pd.DataFrame, Mapping[str, Union[np.ndarray, pd.Index]]]
+OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+# Extension built by compile_kernels.py with ahead-of-time compiled kernels
+AOT_MODULE = 'fast_indicators'
+
+@njit(nogil=True, cache=True, fastmath=True)
+def _ema_adjust_false(x, alpha):
+    """EMA recursion matching pandas ewm(adjust=False): y[i] = alpha*x[i] + (1-alpha)*y[i-1]"""
+    n = x.shape[0]
+    y = np.empty_like(x)
+    if n == 0:
+        return y
+    
+    y[0] = x[0]
+    for i in range(1, n):
+        y[i] = alpha * x[i] + (1.0 - alpha) * y[i - 1]
+    return y
+
+@njit(nogil=True, cache=True, fastmath=True)
+def _rsi_wilder(close, period):
+    """Single-pass Wilder RSI plus the final average gain/loss; values before index period are NaN"""
+    n = close.shape[0]
+    rsi = np.full_like(close, np.nan)
+    if n <= period:
+        return rsi, np.nan, np.nan
+    
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        delta = close[i] - close[i - 1]
+        if delta > 0:
+            avg_gain += delta
+        else:
+            avg_loss -= delta
+    avg_gain /= period
+    avg_loss /= period
+    
+    for i in range(period, n):
+        if i > period:
+            delta = close[i] - close[i - 1]
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+        
+        if avg_loss == 0.0:
+            rsi[i] = 100.0
+        else:
+            rsi[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return rsi, avg_gain, avg_loss
+
+@njit(nogil=True, cache=True, fastmath=True)
+def _atr_wilder(high, low, close, period):
+    """Single-pass true range with Wilder smoothing; values before index period-1 are NaN"""
+    n = close.shape[0]
+    atr = np.full_like(close, np.nan)
+    if n < period:
+        return atr
+    
+    total = 0.0
+    avg = 0.0
+    for i in range(n):
+        tr = high[i] - low[i]
+        if i > 0:
+            tr = max(tr, abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+        
+        if i < period:
+            total += tr
+            if i == period - 1:
+                avg = total / period
+                atr[i] = avg
+        else:
+            avg = (avg * (period - 1) + tr) / period
+            atr[i] = avg
+    return atr
+
+@njit(nogil=True, cache=True, fastmath=True)
+def _compute_all(close, high, low, volume, ema_short_period, ema_long_period, rsi_period, atr_period,
+                 sr_lookback, volume_period):
+    """
+    One pass over the bars computing both EMAs, Wilder RSI and ATR, and the
+    rolling high/low/volume mean; returns the arrays plus the final RSI averages
+    """
+    n = close.shape[0]
+    ema_short = np.empty_like(close)
+    ema_long = np.empty_like(close)
+    rsi = np.full_like(close, np.nan)
+    atr = np.full_like(close, np.nan)
+    rolling_high = np.empty_like(high)
+    rolling_low = np.empty_like(low)
+    volume_mean = np.empty(n)
+    
+    alpha_short = 2.0 / (ema_short_period + 1)
+    alpha_long = 2.0 / (ema_long_period + 1)
+    ema_short_value = 0.0
+    ema_long_value = 0.0
+    avg_gain = 0.0
+    avg_loss = 0.0
+    atr_value = 0.0
+    volume_sum = 0.0
+    
+    # Monotonic queues of bar indices for the rolling high and low
+    high_queue = np.empty(n, dtype=np.int64)
+    low_queue = np.empty(n, dtype=np.int64)
+    high_head = 0
+    high_tail = 0
+    low_head = 0
+    low_tail = 0
+    
+    for i in range(n):
+        price = close[i]
+        if i == 0:
+            ema_short_value = price
+            ema_long_value = price
+            true_range = high[i] - low[i]
+        else:
+            ema_short_value = alpha_short * price + (1.0 - alpha_short) * ema_short_value
+            ema_long_value = alpha_long * price + (1.0 - alpha_long) * ema_long_value
+            
+            prev_close = close[i - 1]
+            delta = price - prev_close
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            if i <= rsi_period:
+                avg_gain += gain
+                avg_loss += loss
+                if i == rsi_period:
+                    avg_gain /= rsi_period
+                    avg_loss /= rsi_period
+            else:
+                avg_gain = (avg_gain * (rsi_period - 1) + gain) / rsi_period
+                avg_loss = (avg_loss * (rsi_period - 1) + loss) / rsi_period
+            
+            true_range = max(high[i] - low[i], abs(high[i] - prev_close), abs(low[i] - prev_close))
+        
+        ema_short[i] = ema_short_value
+        ema_long[i] = ema_long_value
+        
+        if i >= rsi_period:
+            if avg_loss == 0.0:
+                rsi[i] = 100.0
+            else:
+                rsi[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        
+        if i < atr_period:
+            atr_value += true_range
+            if i == atr_period - 1:
+                atr_value /= atr_period
+                atr[i] = atr_value
+        else:
+            atr_value = (atr_value * (atr_period - 1) + true_range) / atr_period
+            atr[i] = atr_value
+        
+        while high_tail > high_head and high[high_queue[high_tail - 1]] <= high[i]:
+            high_tail -= 1
+        high_queue[high_tail] = i
+        high_tail += 1
+        if high_queue[high_head] <= i - sr_lookback:
+            high_head += 1
+        rolling_high[i] = high[high_queue[high_head]]
+        
+        while low_tail > low_head and low[low_queue[low_tail - 1]] >= low[i]:
+            low_tail -= 1
+        low_queue[low_tail] = i
+        low_tail += 1
+        if low_queue[low_head] <= i - sr_lookback:
+            low_head += 1
+        rolling_low[i] = low[low_queue[low_head]]
+        
+        volume_sum += volume[i]
+        if i >= volume_period:
+            volume_sum -= volume[i - volume_period]
+        volume_mean[i] = volume_sum / min(i + 1, volume_period)
+    
+    if n <= rsi_period:
+        avg_gain = np.nan
+        avg_loss = np.nan
+    return ema_short, ema_long, rsi, atr, rolling_high, rolling_low, volume_mean, avg_gain, avg_loss
+
+try:
+    _aot_kernels = importlib.import_module(f'.{AOT_MODULE}', __package__)
+except ImportError:  # Not built; the njit kernels compile on first use instead
+    _aot_kernels = None
+
+def _prefer_aot(name, jit_kernel):
+    """Dispatch to the precompiled export matching the argument dtypes, falling back to jit_kernel"""
+    if _aot_kernels is None:
+        return jit_kernel
+    
+    def kernel(*args):
+        dtypes = '_'.join(f'{arg.dtype.kind}{arg.dtype.itemsize}' for arg in args if isinstance(arg, np.ndarray))
+        export = getattr(_aot_kernels, f'{name}_{dtypes}', None)
+        if export is not None:
+            try:
+                return export(*args)
+            except TypeError:  # Array layout or flags the export was not built for
+                pass
+        return jit_kernel(*args)
+    return kernel
+
+_ema_kernel = _prefer_aot('ema_adjust_false', _ema_adjust_false)
+_rsi_kernel = _prefer_aot('rsi_wilder', _rsi_wilder)
+_atr_kernel = _prefer_aot('atr_wilder', _atr_wilder)
+_compute_all_kernel = _prefer_aot('compute_all', _compute_all)
+
+def bars_from_frame(df: pd.DataFrame) -> Dict[str, Union[np.ndarray, pd.Index]]:
+    """Split an OHLCV DataFrame once into read-only views of its column arrays plus its 'timestamp' index"""
+    bars = {column: _read_only(df[column].to_numpy()) for column in OHLCV_COLUMNS}
+    # The index is immutable already; to_numpy() would box every tz-aware timestamp into an object array
+    bars['timestamp'] = df.index
+    return bars
+
+def _read_only(values: np.ndarray) -> np.ndarray:
+    """Read-only view of values, safe to share without copying"""
+    view = values.view()
+    view.flags.writeable = False
+    return view
+
+def _bar_timestamps(bars: Bars) -> Union[pd.Index, np.ndarray]:
+    """Timestamps of bars, from the DataFrame index or the 'timestamp' column"""
+    return bars.index if isinstance(bars, pd.DataFrame) else bars['timestamp']
+
+def _float_values(data: Union[pd.Series, np.ndarray]) -> np.ndarray:
+    """Underlying float32/float64 array of data; other dtypes are converted to float64"""
+    values = data if isinstance(data, np.ndarray) else data.to_numpy()
+    if values.dtype != np.float32:
+        values = values.astype(np.float64, copy=False)
+    return values
+
+@lru_cache(maxsize=None)
+def _load_lfilter():
+    """scipy.signal.lfilter, imported on first use (scipy.signal is slow to import); None without scipy"""
+    try:
+        from scipy.signal import lfilter
+    except ImportError:  # pandas ewm is used for the smoothing fallback instead
+        return None
+    return lfilter
+
+def _exp_smooth(x: np.ndarray, alpha: float) -> np.ndarray:
+    """y[0] = x[0], y[i] = alpha*x[i] + (1-alpha)*y[i-1] without numba (same as ewm(adjust=False))"""
+    lfilter = _load_lfilter()
+    if lfilter is None or x.shape[0] == 0:
+        smoothed = pd.Series(x).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+    else:
+        smoothed, _ = lfilter([alpha], [1.0, alpha - 1.0], x, zi=[x[0] * (1.0 - alpha)])
+    # Both compute in float64; return the input dtype like the numba kernels do
+    return smoothed.astype(x.dtype, copy=False)
+
+def _wilder_smooth(x: np.ndarray, period: int, start: int) -> np.ndarray:
+    """Wilder smoothing from index start, seeded with the mean of the period values ending there"""
+    out = np.full(x.shape[0], np.nan, dtype=x.dtype)
+    if x.shape[0] <= start:
+        return out
+    
+    seeded = x[start:].copy()
+    seeded[0] = x[start - period + 1:start + 1].mean()
+    out[start:] = _exp_smooth(seeded, 1.0 / period)
+    return out
 
 class TechnicalIndicators:
     """Calculate technical indicators for trading signals"""
     
     def __init__(self):
-        self.config = Config()
+        self.config = CONFIG
+        self._cache: Dict[Tuple[int, int, float], Dict[str, Any]] = {}
+        self._state: Optional[Dict[str, Any]] = None
+        
+        # RSI bands, read once so SignalGenerator scores against the same levels
+        self.rsi_oversold = self.config.RSI_OVERSOLD
+        self.rsi_overbought = self.config.RSI_OVERBOUGHT
+        
+        # Streaming support/resistance: (bar number, price) deques kept monotonic
+        self._sr_lookback: Optional[int] = None
+        self._sr_bar = 0
+        self._sr_highs: deque = deque()
+        self._sr_lows: deque = deque()
+    
+    @staticmethod
+    def cache_key(bars: Bars) -> Optional[Tuple[int, int, float]]:
+        """Key identifying bars by their last timestamp, length and last close; None without bars"""
+        close = np.asarray(bars['close'])
+        if close.shape[0] == 0:
+            return None
+        return TechnicalIndicators._cache_key(_bar_timestamps(bars), close)
+    
+    @staticmethod
+    def _cache_key(timestamps: Union[pd.Index, np.ndarray], close: np.ndarray) -> Tuple[int, int, float]:
+        """cache_key from already extracted timestamp and close arrays"""
+        return (pd.Timestamp(timestamps[-1]).value, close.shape[0], float(close[-1]))
     
-    def calculate_ema(self, data: pd.Series, period: int) -> pd.Series:
+    def calculate_ema(self, data: np.ndarray, period: int) -> np.ndarray:
         """
         Calculate Exponential Moving Average
         
         Args:
-            data: Price series (typically close prices)
+            data: Price array (typically close prices)
             period: EMA period
             
         Returns:
-            EMA series
+            EMA array
         """
-        return data.ewm(span=period, adjust=False).mean()
+        values = _float_values(data)
+        if not NUMBA_AVAILABLE:
+            return _exp_smooth(values, 2.0 / (period + 1))
+        
+        return _ema_kernel(values, 2.0 / (period + 1))
     
-    def calculate_rsi(self, data: pd.Series, period: int = 14) -> pd.Series:
+    def calculate_ema_series(self, data: pd.Series, period: int) -> pd.Series:
         """
-        Calculate Relative Strength Index
+        Calculate Exponential Moving Average for a pandas series
         
         Args:
             data: Price series (typically close prices)
+            period: EMA period
+            
+        Returns:
+            EMA series sharing data's index
+        """
+        return pd.Series(self.calculate_ema(data.to_numpy(), period), index=data.index, copy=False)
+    
+    def calculate_rsi(self, data: np.ndarray, period: int = 14) -> np.ndarray:
+        """
+        Calculate Relative Strength Index using Wilder's smoothing
+        
+        Args:
+            data: Price array (typically close prices)
             period: RSI period (default 14)
             
         Returns:
-            RSI series
+            RSI array
         """
-        delta = data.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+        return self._rsi_with_state(_float_values(data), period)[0]
+    
+    def _rsi_with_state(self, values: np.ndarray, period: int) -> Tuple[np.ndarray, float, float]:
+        """Wilder RSI array with the final average gain and loss needed to extend it"""
+        if NUMBA_AVAILABLE:
+            return _rsi_kernel(values, period)
+        
+        # A NaN of the input dtype keeps float32 prices in float32
+        delta = np.diff(values, prepend=values.dtype.type(np.nan))
+        avg_gain = _wilder_smooth(np.maximum(delta, 0.0), period, period)
+        avg_loss = _wilder_smooth(-np.minimum(delta, 0.0), period, period)
         
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
+        # 100 - 100 / (1 + gain/loss) == 100 * gain / (gain + loss); a flat window counts as 100
+        total = avg_gain + avg_loss
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi = 100.0 * avg_gain / total
+        rsi[total == 0.0] = 100.0
         
-        return rsi
+        if values.shape[0] <= period:
+            return rsi, np.nan, np.nan
+        return rsi, float(avg_gain[-1]), float(avg_loss[-1])
     
-    def calculate_atr(self, high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> pd.Series:
+    def calculate_atr(self, high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
         """
-        Calculate Average True Range for volatility measurement
+        Calculate Average True Range (Wilder) for volatility measurement
         
         Args:
-            high: High price series
-            low: Low price series
-            close: Close price series
+            high: High price array
+            low: Low price array
+            close: Close price array
             period: ATR period
             
         Returns:
-            ATR series
+            ATR array
         """
-        high_low = high - low
-        high_close = np.abs(high - close.shift())
-        low_close = np.abs(low - close.shift())
+        h, l, c = (_float_values(x) for x in (high, low, close))
         
-        true_range = np.maximum(high_low, np.maximum(high_close, low_close))
-        atr = true_range.rolling(window=period).mean()
+        if NUMBA_AVAILABLE:
+            atr = _atr_kernel(h, l, c, period)
+        else:
+            # Previous closes come from the c[:-1] view rather than a shifted copy
+            true_range = np.empty_like(c)
+            true_range[:1] = h[:1] - l[:1]
+            true_range[1:] = np.maximum(h[1:] - l[1:], np.maximum(np.abs(h[1:] - c[:-1]), np.abs(l[1:] - c[:-1])))
+            atr = _wilder_smooth(true_range, period, period - 1)
         
         return atr
     
@@ -78,10 +415,83 @@ class TechnicalIndicators:
         Returns:
             Dictionary with support and resistance levels
         """
-        recent_high = high.tail(lookback).max()
-        recent_low = low.tail(lookback).min()
-        current_price = close.iloc[-1]
+        recent_high = _window_max(high.to_numpy()[-lookback:])
+        recent_low = _window_min(low.to_numpy()[-lookback:])
+        current_price = close.iat[-1]
         
+        return self._pivot_levels(recent_high, recent_low, current_price)
+    
+    def calculate_support_resistance_series(self, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                                            lookback: int = 20) -> Dict[str, np.ndarray]:
+        """
+        Calculate support and resistance levels at every bar
+        
+        Each bar's levels equal calculate_support_resistance on the bars up to
+        and including it, so the first lookback - 1 bars use a shorter window.
+        
+        Args:
+            high: High price array
+            low: Low price array
+            close: Close price array
+            lookback: Number of periods to look back
+            
+        Returns:
+            Dictionary with support and resistance level arrays
+        """
+        recent_high = np.maximum.accumulate(high)
+        recent_low = np.minimum.accumulate(low)
+        if high.shape[0] >= lookback:
+            windows = np.lib.stride_tricks.sliding_window_view
+            recent_high[lookback - 1:] = windows(high, lookback).max(axis=1)
+            recent_low[lookback - 1:] = windows(low, lookback).min(axis=1)
+        
+        # The pivot formulas apply elementwise to the level arrays
+        return self._pivot_levels(recent_high, recent_low, close)
+    
+    def update_support_resistance(self, new_high: float, new_low: float, new_close: float,
+                                  lookback: int = 20) -> Dict[str, float]:
+        """
+        Update support and resistance levels with one new bar
+        
+        Keeps a rolling max/min of the last lookback bars in monotonic deques,
+        so each update is O(1) amortized. Changing lookback restarts the window.
+        
+        Args:
+            new_high: High price of the new bar
+            new_low: Low price of the new bar
+            new_close: Close price of the new bar
+            lookback: Number of periods to look back
+            
+        Returns:
+            Dictionary with support and resistance levels
+        """
+        if lookback != self._sr_lookback:
+            self._sr_lookback = lookback
+            self._sr_bar = 0
+            self._sr_highs.clear()
+            self._sr_lows.clear()
+        
+        self._sr_bar += 1
+        oldest_bar = self._sr_bar - lookback
+        
+        highs = self._sr_highs
+        while highs and highs[-1][1] <= new_high:
+            highs.pop()
+        highs.append((self._sr_bar, new_high))
+        if highs[0][0] <= oldest_bar:
+            highs.popleft()
+        
+        lows = self._sr_lows
+        while lows and lows[-1][1] >= new_low:
+            lows.pop()
+        lows.append((self._sr_bar, new_low))
+        if lows[0][0] <= oldest_bar:
+            lows.popleft()
+        
+        return self._pivot_levels(highs[0][1], lows[0][1], new_close)
+    
+    def _pivot_levels(self, recent_high: float, recent_low: float, current_price: float) -> Dict[str, float]:
+        """Pivot point with first support and resistance levels"""
         # Calculate pivot points
         pivot = (recent_high + recent_low + current_price) / 3
         resistance1 = 2 * pivot - recent_low
@@ -106,9 +516,12 @@ class TechnicalIndicators:
         Returns:
             Dictionary with volume metrics
         """
-        recent_volume = volume.tail(period)
-        avg_volume = recent_volume.mean()
-        current_volume = volume.iloc[-1]
+        avg_volume = _window_mean(volume.to_numpy()[-period:])
+        
+        return self._volume_levels(volume.iat[-1], avg_volume)
+    
+    def _volume_levels(self, current_volume: float, avg_volume: float) -> Dict[str, float]:
+        """Current volume relative to its recent average"""
         volume_ratio = current_volume / avg_volume if avg_volume > 0 else 1.0
         
         return {
@@ -118,19 +531,19 @@ class TechnicalIndicators:
             'is_high_volume': volume_ratio > 1.5
         }
     
-    def calculate_trend_strength(self, ema_short: pd.Series, ema_long: pd.Series) -> Dict[str, Any]:
+    def calculate_trend_strength(self, ema_short: np.ndarray, ema_long: np.ndarray) -> Dict[str, Any]:
         """
         Calculate trend strength based on EMA separation
         
         Args:
-            ema_short: Short EMA series
-            ema_long: Long EMA series
+            ema_short: Short EMA array
+            ema_long: Long EMA array
             
         Returns:
             Dictionary with trend metrics
         """
-        current_short = ema_short.iloc[-1]
-        current_long = ema_long.iloc[-1]
+        current_short = ema_short[-1]
+        current_long = ema_long[-1]
         
         # Calculate percentage separation
         separation = abs(current_short - current_long) / current_long * 100
@@ -154,13 +567,13 @@ class TechnicalIndicators:
             'ema_long': current_long
         }
     
-    def detect_ema_crossover(self, ema_short: pd.Series, ema_long: pd.Series) -> Dict[str, Any]:
+    def detect_ema_crossover(self, ema_short: np.ndarray, ema_long: np.ndarray) -> Dict[str, Any]:
         """
         Detect EMA crossover signals
         
         Args:
-            ema_short: Short EMA series
-            ema_long: Long EMA series
+            ema_short: Short EMA array
+            ema_long: Long EMA array
             
         Returns:
             Dictionary with crossover information
@@ -169,10 +582,8 @@ class TechnicalIndicators:
             return {'crossover': 'NONE', 'signal_strength': 0.0}
         
         # Current and previous values
-        current_short = ema_short.iloc[-1]
-        current_long = ema_long.iloc[-1]
-        prev_short = ema_short.iloc[-2]
-        prev_long = ema_long.iloc[-2]
+        current_short, prev_short = ema_short[-1], ema_short[-2]
+        current_long, prev_long = ema_long[-1], ema_long[-2]
         
         crossover = 'NONE'
         signal_strength = 0.0
@@ -193,23 +604,23 @@ class TechnicalIndicators:
             'previous_separation': abs(prev_short - prev_long)
         }
     
-    def analyze_rsi_conditions(self, rsi: pd.Series) -> Dict[str, Any]:
+    def analyze_rsi_conditions(self, rsi: np.ndarray) -> Dict[str, Any]:
         """
         Analyze RSI conditions for trading signals
         
         Args:
-            rsi: RSI series
+            rsi: RSI array
             
         Returns:
             Dictionary with RSI analysis
         """
-        current_rsi = rsi.iloc[-1]
+        current_rsi = rsi[-1]
         
         # Determine RSI condition
-        if current_rsi >= self.config.RSI_OVERBOUGHT:
+        if current_rsi >= self.rsi_overbought:
             condition = 'OVERBOUGHT'
             signal_bias = 'SELL'
-        elif current_rsi <= self.config.RSI_OVERSOLD:
+        elif current_rsi <= self.rsi_oversold:
             condition = 'OVERSOLD'
             signal_bias = 'BUY'
         else:
@@ -217,69 +628,185 @@ class TechnicalIndicators:
             signal_bias = 'NEUTRAL'
         
         # Calculate RSI momentum (change from previous period)
-        rsi_momentum = rsi.iloc[-1] - rsi.iloc[-2] if len(rsi) >= 2 else 0
+        rsi_momentum = current_rsi - rsi[-2] if len(rsi) >= 2 else 0
         
         return {
             'current_rsi': current_rsi,
             'condition': condition,
             'signal_bias': signal_bias,
             'momentum': rsi_momentum,
-            'is_overbought': current_rsi >= self.config.RSI_OVERBOUGHT,
-            'is_oversold': current_rsi <= self.config.RSI_OVERSOLD
+            'is_overbought': current_rsi >= self.rsi_overbought,
+            'is_oversold': current_rsi <= self.rsi_oversold
         }
     
-    def calculate_all_indicators(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def calculate_all_indicators(self, bars: Bars) -> Dict[str, Any]:
         """
         Calculate all technical indicators for the given data
         
         Args:
-            df: DataFrame with OHLCV data
+            bars: DataFrame with OHLCV data, or a dict of 'timestamp' and OHLCV arrays
             
         Returns:
-            Dictionary with all calculated indicators
+            Dictionary with all calculated indicators (indicator series as arrays)
         """
-        try:
-            # Calculate EMAs
-            ema_short = self.calculate_ema(df['close'], self.config.EMA_SHORT_PERIOD)
-            ema_long = self.calculate_ema(df['close'], self.config.EMA_LONG_PERIOD)
-            
-            # Calculate RSI
-            rsi = self.calculate_rsi(df['close'], self.config.RSI_PERIOD)
-            
-            # Calculate ATR
-            atr = self.calculate_atr(df['high'], df['low'], df['close'])
-            
-            # Calculate support/resistance
-            support_resistance = self.calculate_support_resistance(
-                df['high'], df['low'], df['close']
-            )
-            
-            # Calculate volume profile
-            volume_profile = self.calculate_volume_profile(df['volume'])
-            
-            # Analyze trend strength
-            trend_analysis = self.calculate_trend_strength(ema_short, ema_long)
-            
-            # Detect EMA crossover
-            crossover_analysis = self.detect_ema_crossover(ema_short, ema_long)
-            
-            # Analyze RSI conditions
-            rsi_analysis = self.analyze_rsi_conditions(rsi)
-            
-            return {
-                'ema_short': ema_short,
-                'ema_long': ema_long,
-                'rsi': rsi,
-                'atr': atr,
-                'current_price': df['close'].iloc[-1],
-                'support_resistance': support_resistance,
-                'volume_profile': volume_profile,
-                'trend_analysis': trend_analysis,
-                'crossover_analysis': crossover_analysis,
-                'rsi_analysis': rsi_analysis,
-                'timestamp': df.index[-1]
-            }
-            
-        except Exception as e:
-            print(f"❌ Error calculating indicators: {str(e)}")
+        # Extract the columns once and share the arrays across all indicators
+        index = _bar_timestamps(bars)
+        close = _float_values(bars['close'])
+        high = _float_values(bars['high'])
+        low = _float_values(bars['low'])
+        volume = np.asarray(bars['volume'])
+        
+        # Too few bars for the longest recurrence plus a previous value to compare against
+        if close.shape[0] < max(self.config.EMA_LONG_PERIOD, self.config.RSI_PERIOD + 1, self.config.ATR_PERIOD) + 2:
             return {}
+        
+        # Identical polls return the stored result
+        key = self._cache_key(index, close)
+        cached = self._cache.pop(key, None)
+        if cached is not None:
+            self._cache[key] = cached
+            return cached
+        
+        # Calculate EMAs, RSI, ATR and the rolling windows, stepping the
+        # recurrences when only one bar was appended
+        computed = self._extend_indicator_series(index, close, high, low, volume)
+        if computed is None:
+            computed = self._compute_indicator_series(index, close, high, low, volume)
+        (ema_short, ema_long, rsi, atr), (recent_high, recent_low, avg_volume) = computed
+        current_price = close[-1]
+        
+        # The series are shared by the cache, the one-bar update state and every consumer of the
+        # result without copies, so nobody may modify them in place
+        for series in (ema_short, ema_long, rsi, atr):
+            series.flags.writeable = False
+        
+        # Calculate support/resistance
+        support_resistance = self._pivot_levels(recent_high, recent_low, current_price)
+        
+        # Calculate volume profile
+        volume_profile = self._volume_levels(volume[-1], avg_volume)
+        
+        # Analyze trend strength
+        trend_analysis = self.calculate_trend_strength(ema_short, ema_long)
+        
+        # Detect EMA crossover
+        crossover_analysis = self.detect_ema_crossover(ema_short, ema_long)
+        
+        # Analyze RSI conditions
+        rsi_analysis = self.analyze_rsi_conditions(rsi)
+        
+        result = {
+            'ema_short': ema_short,
+            'ema_long': ema_long,
+            'rsi': rsi,
+            'atr': atr,
+            'current_price': current_price,
+            'support_resistance': support_resistance,
+            'volume_profile': volume_profile,
+            'trend_analysis': trend_analysis,
+            'crossover_analysis': crossover_analysis,
+            'rsi_analysis': rsi_analysis,
+            'timestamp': pd.Timestamp(index[-1])
+        }
+        
+        self._cache[key] = result
+        if len(self._cache) > INDICATOR_CACHE_SIZE:
+            del self._cache[next(iter(self._cache))]
+        
+        return result
+    
+    def _compute_indicator_series(self, index: Union[pd.Index, np.ndarray], close: np.ndarray, high: np.ndarray, low: np.ndarray,
+                                  volume: np.ndarray) -> Tuple[Tuple[np.ndarray, ...], Tuple[float, float, float]]:
+        """Run the indicator recurrences over all bars and keep their final state"""
+        if NUMBA_AVAILABLE:
+            (ema_short, ema_long, rsi, atr, rolling_high, rolling_low, volume_mean,
+             avg_gain, avg_loss) = _compute_all_kernel(
+                close, high, low, volume,
+                self.config.EMA_SHORT_PERIOD, self.config.EMA_LONG_PERIOD, self.config.RSI_PERIOD,
+                self.config.ATR_PERIOD, self.config.SUPPORT_RESISTANCE_LOOKBACK, self.config.VOLUME_PERIOD
+            )
+            window = (rolling_high[-1], rolling_low[-1], volume_mean[-1])
+        else:
+            ema_short = self.calculate_ema(close, self.config.EMA_SHORT_PERIOD)
+            ema_long = self.calculate_ema(close, self.config.EMA_LONG_PERIOD)
+            rsi, avg_gain, avg_loss = self._rsi_with_state(close, self.config.RSI_PERIOD)
+            atr = self.calculate_atr(high, low, close, self.config.ATR_PERIOD)
+            window = self._window_levels(high, low, volume)
+        
+        series = (ema_short, ema_long, rsi, atr)
+        
+        self._state = {
+            'length': close.shape[0],
+            'last_timestamp': index[-1],
+            'close': close[-1],
+            'avg_gain': avg_gain,
+            'avg_loss': avg_loss,
+            'series': series,
+            'buffers': series  # No spare capacity yet; the first one-bar update reallocates
+        }
+        return series, window
+    
+    def _window_levels(self, high: np.ndarray, low: np.ndarray, volume: np.ndarray) -> Tuple[float, float, float]:
+        """Recent high, recent low and average volume over the configured windows"""
+        lookback = self.config.SUPPORT_RESISTANCE_LOOKBACK
+        return (
+            _window_max(high[-lookback:]),
+            _window_min(low[-lookback:]),
+            _window_mean(volume[-self.config.VOLUME_PERIOD:])
+        )
+    
+    def _extend_indicator_series(self, index: Union[pd.Index, np.ndarray], close: np.ndarray, high: np.ndarray, low: np.ndarray,
+                                 volume: np.ndarray) -> Optional[Tuple[Tuple[np.ndarray, ...], Tuple[float, float, float]]]:
+        """Advance the stored recurrences by one step when the bars are the last computed ones plus one new bar"""
+        state = self._state
+        length = close.shape[0]
+        if (state is None or length != state['length'] + 1
+                or state['length'] <= max(self.config.RSI_PERIOD, self.config.ATR_PERIOD)
+                or index[-2] != state['last_timestamp']
+                or close[-2] != state['close']):
+            return None
+        
+        bar_high = float(high[-1])
+        bar_low = float(low[-1])
+        bar_close = float(close[-1])
+        prev_close = state['close']
+        ema_short, ema_long, rsi, atr = state['series']
+        
+        alpha_short = 2.0 / (self.config.EMA_SHORT_PERIOD + 1)
+        alpha_long = 2.0 / (self.config.EMA_LONG_PERIOD + 1)
+        ema_short_value = alpha_short * bar_close + (1.0 - alpha_short) * ema_short[-1]
+        ema_long_value = alpha_long * bar_close + (1.0 - alpha_long) * ema_long[-1]
+        
+        period = self.config.RSI_PERIOD
+        delta = bar_close - prev_close
+        avg_gain = (state['avg_gain'] * (period - 1) + max(delta, 0.0)) / period
+        avg_loss = (state['avg_loss'] * (period - 1) + max(-delta, 0.0)) / period
+        rsi_value = 100.0 if avg_loss == 0.0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        
+        period = self.config.ATR_PERIOD
+        true_range = max(bar_high - bar_low, abs(bar_high - prev_close), abs(bar_low - prev_close))
+        atr_value = (atr[-1] * (period - 1) + true_range) / period
+        
+        # Write the new values into spare capacity of the series buffers (in their own dtype), growing
+        # them geometrically when full, so a bar costs O(1) amortized instead of copying every series
+        buffers = state['buffers']
+        if buffers[0].shape[0] < length:
+            extra = max(length, SERIES_GROWTH)
+            buffers = tuple(
+                np.concatenate((buffer[:length - 1], np.empty(extra, dtype=buffer.dtype)))
+                for buffer in buffers
+            )
+        for buffer, value in zip(buffers, (ema_short_value, ema_long_value, rsi_value, atr_value)):
+            buffer[length - 1] = value
+        # Earlier results keep views of the shorter prefixes, which later writes never touch
+        series = tuple(buffer[:length] for buffer in buffers)
+        state.update({
+            'length': length,
+            'last_timestamp': index[-1],
+            'close': close[-1],
+            'avg_gain': avg_gain,
+            'avg_loss': avg_loss,
+            'series': series,
+            'buffers': buffers
+        })
+        return series, self._window_levels(high, low, volume)
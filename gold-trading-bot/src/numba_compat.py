@@ -0,0 +1,45 @@
+"""
+Optional Numba support for the numeric kernels
+
+numba is an optional accelerator. Without it, njit leaves functions as plain
+Python and NUMBA_AVAILABLE is False, so callers can pick a vectorized
+NumPy/pandas path instead of running the kernels as Python loops.
+
+numba is slow to import, so it is only located here; njit imports it and
+compiles a kernel on that kernel's first call.
+"""
+
+import functools
+import threading
+from importlib.util import find_spec
+
+NUMBA_AVAILABLE = find_spec('numba') is not None
+
+_compile_lock = threading.Lock()
+
+def njit(*args, **kwargs):
+    """numba.njit that defers importing numba and compiling until the first call"""
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return njit()(args[0])
+    if not NUMBA_AVAILABLE:
+        return lambda func: func
+    
+    def decorate(func):
+        dispatcher = None
+        
+        @functools.wraps(func)
+        def kernel(*call_args):
+            nonlocal dispatcher
+            if dispatcher is None:
+                with _compile_lock:
+                    if dispatcher is None:
+                        try:
+                            from numba import njit as numba_njit
+                            dispatcher = numba_njit(*args, **kwargs)(func)
+                        except ImportError:  # Installed but unusable, e.g. built for another NumPy
+                            dispatcher = func
+            return dispatcher(*call_args)
+        
+        kernel.py_func = func
+        return kernel
+    return decorate
@@ -1,37 +1,118 @@
-import pandas as pd
+from datetime import datetime
 import numpy as np
-from typing import Dict, Any, Tuple
-from config import Config
-from indicators import TechnicalIndicators
+from typing import Dict, Any, NamedTuple, Optional, Tuple
+from .config import CONFIG
+from .indicators import TechnicalIndicators, Bars
+from .numba_compat import njit
+
+# Number of generate_signal results kept per SignalGenerator instance
+SIGNAL_CACHE_SIZE = 8
+
+# Score slot of each component signal; anything else (e.g. volume's NEUTRAL) goes to an unused slot
+SIGNAL_LABELS = ('BUY', 'SELL', 'HOLD')
+SIGNAL_INDEX = {label: i for i, label in enumerate(SIGNAL_LABELS)}
+UNSCORED_INDEX = len(SIGNAL_LABELS)
+
+# Prices within 1% of support (resistance) count as near that level
+SUPPORT_PROXIMITY = 1.01
+RESISTANCE_PROXIMITY = 0.99
+
+# Reasoning that never varies, shared by every analysis (reasoning is only read, never modified)
+NO_EMA_SIGNAL_REASONING = ("No significant EMA signal",)
+
+# SIGNAL_WEIGHTS keys in the component order ema, rsi, volume, trend
+SIGNAL_WEIGHT_KEYS = ('ema_crossover', 'rsi_confirmation', 'volume_confirmation', 'trend_strength')
+
+class Signal(NamedTuple):
+    """Trading signal with its component analyses, risk levels and market context"""
+    timestamp: Any
+    current_price: float
+    signal: str
+    signal_strength: float
+    confidence: float
+    components: Dict[str, Dict[str, Any]]
+    risk_management: Dict[str, Any]
+    market_context: Dict[str, Any]
+    recommendation: str
+    error: Optional[str] = None  # Set only on 'ERROR' signals
+
+@njit(nogil=True, cache=True)
+def _composite_scores(strengths, weights, signs):
+    """Weighted BUY/SELL/HOLD score sums; components with any other sign index are not scored"""
+    buy = 0.0
+    sell = 0.0
+    hold = 0.0
+    for i in range(strengths.shape[0]):
+        weighted = strengths[i] * weights[i]
+        if signs[i] == 0:
+            buy += weighted
+        elif signs[i] == 1:
+            sell += weighted
+        elif signs[i] == 2:
+            hold += weighted
+    return buy, sell, hold
 
 class SignalGenerator:
-    """Generate trading signals based on technical analysis"""
+    """
+    Generate trading signals based on technical analysis
+    
+    Thresholds, multipliers and weights are read from the config when the
+    generator (and its TechnicalIndicators) is created; create a new generator
+    after changing them.
+    """
+    
+    __slots__ = ('config', 'indicators', '_cache', '_bullish_crossover_reasoning', '_bearish_crossover_reasoning',
+                 '_rsi_oversold', '_rsi_overbought', '_stop_loss_atr_multiplier', '_take_profit_ratio',
+                 '_signal_weights')
     
     def __init__(self):
-        self.config = Config()
+        self.config = CONFIG
         self.indicators = TechnicalIndicators()
+        self._cache: Dict[Tuple[int, int, float], Signal] = {}
+        
+        # Configuration read on every signal, bound once per generator
+        config = self.config
+        short_ema, long_ema = f"EMA-{config.EMA_SHORT_PERIOD}", f"EMA-{config.EMA_LONG_PERIOD}"
+        self._bullish_crossover_reasoning = (f"{short_ema} crossed above {long_ema}",)
+        self._bearish_crossover_reasoning = (f"{short_ema} crossed below {long_ema}",)
+        self._rsi_oversold = self.indicators.rsi_oversold
+        self._rsi_overbought = self.indicators.rsi_overbought
+        self._stop_loss_atr_multiplier = config.STOP_LOSS_ATR_MULTIPLIER
+        self._take_profit_ratio = config.TAKE_PROFIT_RATIO
+        self._signal_weights = np.array([config.SIGNAL_WEIGHTS[key] for key in SIGNAL_WEIGHT_KEYS], dtype=np.float64)
     
-    def generate_signal(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def generate_signal(self, bars: Bars) -> Signal:
         """
         Generate comprehensive trading signal based on multiple indicators
         
         Args:
-            df: DataFrame with OHLCV data
+            bars: DataFrame with OHLCV data, or a dict of 'timestamp' and OHLCV arrays
             
         Returns:
-            Dictionary with signal information
+            Signal with the composite signal and its supporting analysis
         """
+        # Unchanged bars (same last timestamp, length and close) return the stored signal
+        key = TechnicalIndicators.cache_key(bars)
+        cached = self._cache.pop(key, None)
+        if cached is not None:
+            self._cache[key] = cached
+            return cached
+        
         # Calculate all indicators
-        indicator_data = self.indicators.calculate_all_indicators(df)
+        indicator_data = self.indicators.calculate_all_indicators(bars)
         
         if not indicator_data:
             return self._create_error_signal("Failed to calculate indicators")
         
+        trend = indicator_data['trend_analysis']
+        support_resistance = indicator_data['support_resistance']
+        current_price = indicator_data['current_price']
+        
         # Analyze individual components
-        ema_signal = self._analyze_ema_signal(indicator_data)
-        rsi_signal = self._analyze_rsi_signal(indicator_data)
-        volume_signal = self._analyze_volume_signal(indicator_data)
-        trend_signal = self._analyze_trend_signal(indicator_data)
+        ema_signal = self._analyze_ema_signal(indicator_data['crossover_analysis'], trend)
+        rsi_signal = self._analyze_rsi_signal(indicator_data['rsi_analysis'])
+        volume_signal = self._analyze_volume_signal(indicator_data['volume_profile'])
+        trend_signal = self._analyze_trend_signal(trend, support_resistance, current_price)
         
         # Calculate composite signal
         composite_signal = self._calculate_composite_signal(
@@ -39,57 +120,57 @@ class SignalGenerator:
         )
         
         # Generate risk management levels
-        risk_levels = self._calculate_risk_levels(df, indicator_data, composite_signal)
+        risk_levels = self._calculate_risk_levels(indicator_data, composite_signal)
         
         # Create final signal package
-        final_signal = {
-            'timestamp': indicator_data['timestamp'],
-            'current_price': indicator_data['current_price'],
-            'signal': composite_signal['signal'],
-            'signal_strength': composite_signal['strength'],
-            'confidence': composite_signal['confidence'],
-            'components': {
+        final_signal = Signal(
+            indicator_data['timestamp'],
+            current_price,
+            composite_signal['signal'],
+            composite_signal['strength'],
+            composite_signal['confidence'],
+            {
                 'ema': ema_signal,
                 'rsi': rsi_signal,
                 'volume': volume_signal,
                 'trend': trend_signal
             },
-            'risk_management': risk_levels,
-            'market_context': self._get_market_context(indicator_data),
-            'recommendation': self._generate_recommendation(composite_signal, risk_levels)
-        }
+            risk_levels,
+            self._get_market_context(indicator_data),
+            self._generate_recommendation(composite_signal, risk_levels)
+        )
+        
+        self._cache[key] = final_signal
+        if len(self._cache) > SIGNAL_CACHE_SIZE:
+            del self._cache[next(iter(self._cache))]
         
         return final_signal
     
-    def _analyze_ema_signal(self, indicator_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_ema_signal(self, crossover: Dict[str, Any], trend: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze EMA crossover signals"""
-        crossover = indicator_data['crossover_analysis']
-        trend = indicator_data['trend_analysis']
-        
         signal = 'HOLD'
         strength = 0.0
-        reasoning = []
         
         if crossover['crossover'] == 'BULLISH':
             signal = 'BUY'
             strength = crossover['signal_strength']
-            reasoning.append(f"EMA-{self.config.EMA_SHORT_PERIOD} crossed above EMA-{self.config.EMA_LONG_PERIOD}")
+            reasoning = self._bullish_crossover_reasoning
         elif crossover['crossover'] == 'BEARISH':
             signal = 'SELL'
             strength = crossover['signal_strength']
-            reasoning.append(f"EMA-{self.config.EMA_SHORT_PERIOD} crossed below EMA-{self.config.EMA_LONG_PERIOD}")
+            reasoning = self._bearish_crossover_reasoning
         else:
             # No crossover, check trend strength
             if trend['direction'] == 'BULLISH' and trend['strength'] > 2.0:
                 signal = 'BUY'
                 strength = trend['strength'] * 0.5  # Reduced strength for trend-only signals
-                reasoning.append(f"Strong bullish trend (separation: {trend['separation_percent']:.2f}%)")
+                reasoning = (f"Strong bullish trend (separation: {trend['separation_percent']:.2f}%)",)
             elif trend['direction'] == 'BEARISH' and trend['strength'] > 2.0:
                 signal = 'SELL'
                 strength = trend['strength'] * 0.5
-                reasoning.append(f"Strong bearish trend (separation: {trend['separation_percent']:.2f}%)")
+                reasoning = (f"Strong bearish trend (separation: {trend['separation_percent']:.2f}%)",)
             else:
-                reasoning.append("No significant EMA signal")
+                reasoning = NO_EMA_SIGNAL_REASONING
         
         return {
             'signal': signal,
@@ -100,36 +181,34 @@ class SignalGenerator:
             'trend_strength': trend['strength']
         }
     
-    def _analyze_rsi_signal(self, indicator_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_rsi_signal(self, rsi_data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze RSI-based signals"""
-        rsi_data = indicator_data['rsi_analysis']
-        
         signal = 'HOLD'
         strength = 0.0
-        reasoning = []
         
         current_rsi = rsi_data['current_rsi']
+        momentum = rsi_data['momentum']
         
         if rsi_data['is_oversold']:
             signal = 'BUY'
-            strength = (self.config.RSI_OVERSOLD - current_rsi) / 10  # Strength based on how oversold
-            reasoning.append(f"RSI oversold at {current_rsi:.1f}")
+            strength = (self._rsi_oversold - current_rsi) / 10  # Strength based on how oversold
+            reasoning = ("RSI oversold at %.1f" % current_rsi,)
         elif rsi_data['is_overbought']:
             signal = 'SELL'
-            strength = (current_rsi - self.config.RSI_OVERBOUGHT) / 10  # Strength based on how overbought
-            reasoning.append(f"RSI overbought at {current_rsi:.1f}")
+            strength = (current_rsi - self._rsi_overbought) / 10  # Strength based on how overbought
+            reasoning = ("RSI overbought at %.1f" % current_rsi,)
         else:
             # Check RSI momentum
-            if rsi_data['momentum'] > 5 and current_rsi < 60:
+            if momentum > 5 and current_rsi < 60:
                 signal = 'BUY'
-                strength = min(rsi_data['momentum'] / 10, 2.0)
-                reasoning.append(f"Strong RSI momentum (+{rsi_data['momentum']:.1f})")
-            elif rsi_data['momentum'] < -5 and current_rsi > 40:
+                strength = min(momentum / 10, 2.0)
+                reasoning = (f"Strong RSI momentum (+{momentum:.1f})",)
+            elif momentum < -5 and current_rsi > 40:
                 signal = 'SELL'
-                strength = min(abs(rsi_data['momentum']) / 10, 2.0)
-                reasoning.append(f"Negative RSI momentum ({rsi_data['momentum']:.1f})")
+                strength = min(abs(momentum) / 10, 2.0)
+                reasoning = (f"Negative RSI momentum ({momentum:.1f})",)
             else:
-                reasoning.append(f"RSI neutral at {current_rsi:.1f}")
+                reasoning = ("RSI neutral at %.1f" % current_rsi,)
         
         return {
             'signal': signal,
@@ -137,27 +216,24 @@ class SignalGenerator:
             'reasoning': reasoning,
             'current_rsi': current_rsi,
             'condition': rsi_data['condition'],
-            'momentum': rsi_data['momentum']
+            'momentum': momentum
         }
     
-    def _analyze_volume_signal(self, indicator_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_volume_signal(self, volume_data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze volume-based confirmation"""
-        volume_data = indicator_data['volume_profile']
-        
         signal = 'NEUTRAL'
         strength = 0.0
-        reasoning = []
         
         volume_ratio = volume_data['volume_ratio']
         
         if volume_data['is_high_volume']:
             strength = min((volume_ratio - 1.0) * 2, 3.0)  # Cap at 3.0
-            reasoning.append(f"High volume confirmation ({volume_ratio:.1f}x average)")
+            reasoning = (f"High volume confirmation ({volume_ratio:.1f}x average)",)
         elif volume_ratio < 0.5:
             strength = -1.0  # Negative strength for low volume
-            reasoning.append(f"Low volume warning ({volume_ratio:.1f}x average)")
+            reasoning = (f"Low volume warning ({volume_ratio:.1f}x average)",)
         else:
-            reasoning.append(f"Normal volume ({volume_ratio:.1f}x average)")
+            reasoning = (f"Normal volume ({volume_ratio:.1f}x average)",)
         
         return {
             'signal': signal,
@@ -167,34 +243,30 @@ class SignalGenerator:
             'is_high_volume': volume_data['is_high_volume']
         }
     
-    def _analyze_trend_signal(self, indicator_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_trend_signal(self, trend_data: Dict[str, Any], support_resistance: Dict[str, float],
+                              current_price: float) -> Dict[str, Any]:
         """Analyze overall trend context"""
-        trend_data = indicator_data['trend_analysis']
-        support_resistance = indicator_data['support_resistance']
-        current_price = indicator_data['current_price']
-        
         signal = 'HOLD'
         strength = 0.0
-        reasoning = []
         
         # Check price position relative to support/resistance
         support = support_resistance['support']
         resistance = support_resistance['resistance']
         
-        if current_price <= support * 1.01:  # Within 1% of support
+        if current_price <= support * SUPPORT_PROXIMITY:
             signal = 'BUY'
             strength = 2.0
-            reasoning.append(f"Price near support level (${support:.2f})")
-        elif current_price >= resistance * 0.99:  # Within 1% of resistance
+            reasoning = (f"Price near support level (${support:.2f})",)
+        elif current_price >= resistance * RESISTANCE_PROXIMITY:
             signal = 'SELL'
             strength = 2.0
-            reasoning.append(f"Price near resistance level (${resistance:.2f})")
+            reasoning = (f"Price near resistance level (${resistance:.2f})",)
         else:
-            reasoning.append(f"Price between support (${support:.2f}) and resistance (${resistance:.2f})")
+            reasoning = (f"Price between support (${support:.2f}) and resistance (${resistance:.2f})",)
         
         # Add trend context
         if trend_data['strength'] > 3.0:
-            reasoning.append(f"Strong {trend_data['direction'].lower()} trend")
+            reasoning += (f"Strong {trend_data['direction'].lower()} trend",)
         
         return {
             'signal': signal,
@@ -205,29 +277,49 @@ class SignalGenerator:
             'trend_direction': trend_data['direction']
         }
     
+    def analyze_trend_signal_batch(self, bars: Bars) -> Dict[str, np.ndarray]:
+        """
+        Support/resistance signal of the trend component at every bar
+        
+        Vectorized counterpart of the price position check in _analyze_trend_signal,
+        so a backtest can evaluate a whole history in one call.
+        
+        Args:
+            bars: DataFrame with OHLCV data, or a dict of 'timestamp' and OHLCV arrays
+            
+        Returns:
+            Dictionary of per-bar arrays: signal ('BUY', 'SELL' or 'HOLD'), strength, support and resistance
+        """
+        close = np.asarray(bars['close'])
+        levels = self.indicators.calculate_support_resistance_series(
+            np.asarray(bars['high']), np.asarray(bars['low']), close, self.config.SUPPORT_RESISTANCE_LOOKBACK
+        )
+        support = levels['support']
+        resistance = levels['resistance']
+        
+        # Near support takes precedence, as in the scalar check
+        buy_mask = close <= support * SUPPORT_PROXIMITY
+        sell_mask = ~buy_mask & (close >= resistance * RESISTANCE_PROXIMITY)
+        
+        return {
+            'signal': np.where(buy_mask, 'BUY', np.where(sell_mask, 'SELL', 'HOLD')),
+            'strength': np.where(buy_mask | sell_mask, 2.0, 0.0),
+            'support': support,
+            'resistance': resistance
+        }
+    
     def _calculate_composite_signal(self, ema_signal: Dict, rsi_signal: Dict, 
                                   volume_signal: Dict, trend_signal: Dict) -> Dict[str, Any]:
         """Calculate weighted composite signal"""
         
-        # Signal scoring
-        signal_scores = {'BUY': 0, 'SELL': 0, 'HOLD': 0}
-        total_strength = 0
-        
-        # Weight and score each component
-        components = [
-            (ema_signal, self.config.SIGNAL_WEIGHTS['ema_crossover']),
-            (rsi_signal, self.config.SIGNAL_WEIGHTS['rsi_confirmation']),
-            (volume_signal, self.config.SIGNAL_WEIGHTS['volume_confirmation']),
-            (trend_signal, self.config.SIGNAL_WEIGHTS['trend_strength'])
-        ]
-        
-        for component, weight in components:
-            if component['signal'] in signal_scores:
-                weighted_strength = component['strength'] * weight
-                signal_scores[component['signal']] += weighted_strength
-                total_strength += abs(weighted_strength)
-        
-        # Determine final signal
+        # Weight each component and sum the weighted strengths per signal
+        components = (ema_signal, rsi_signal, volume_signal, trend_signal)
+        strengths = np.array([component['strength'] for component in components], dtype=np.float64)
+        signs = np.array([SIGNAL_INDEX.get(component['signal'], UNSCORED_INDEX) for component in components],
+                         dtype=np.int8)
+        signal_scores = dict(zip(SIGNAL_LABELS, _composite_scores(strengths, self._signal_weights, signs)))
+        
+        # Determine final signal (ties resolve in BUY, SELL, HOLD order)
         max_signal = max(signal_scores, key=signal_scores.get)
         max_score = signal_scores[max_signal]
         
@@ -254,28 +346,23 @@ class SignalGenerator:
     
     def _calculate_signal_consensus(self, ema_signal: Dict, rsi_signal: Dict, trend_signal: Dict) -> float:
         """Calculate how much the signals agree with each other"""
-        signals = [ema_signal['signal'], rsi_signal['signal'], trend_signal['signal']]
-        
-        # Count signal agreement
-        buy_count = signals.count('BUY')
-        sell_count = signals.count('SELL')
-        hold_count = signals.count('HOLD')
-        
-        # Calculate consensus score
-        max_count = max(buy_count, sell_count, hold_count)
-        consensus = max_count / len(signals)
-        
-        return consensus
+        ema, rsi, trend = ema_signal['signal'], rsi_signal['signal'], trend_signal['signal']
+        
+        # Share of the three signals held by the most common one
+        if ema == rsi == trend:
+            return 1.0
+        if ema == rsi or ema == trend or rsi == trend:
+            return 2 / 3
+        return 1 / 3
     
-    def _calculate_risk_levels(self, df: pd.DataFrame, indicator_data: Dict, 
-                             composite_signal: Dict) -> Dict[str, Any]:
+    def _calculate_risk_levels(self, indicator_data: Dict, composite_signal: Dict) -> Dict[str, Any]:
         """Calculate stop loss and take profit levels"""
         current_price = indicator_data['current_price']
-        atr = indicator_data['atr'].iloc[-1]
+        atr = indicator_data['atr'][-1]
         support_resistance = indicator_data['support_resistance']
         
         # ATR-based stop loss
-        atr_stop_distance = atr * self.config.STOP_LOSS_ATR_MULTIPLIER
+        atr_stop_distance = atr * self._stop_loss_atr_multiplier
         
         if composite_signal['signal'] == 'BUY':
             # For buy signals
@@ -283,7 +370,7 @@ class SignalGenerator:
                 current_price - atr_stop_distance,
                 support_resistance['support'] * 0.99  # Just below support
             )
-            take_profit = current_price + (atr_stop_distance * self.config.TAKE_PROFIT_RATIO)
+            take_profit = current_price + (atr_stop_distance * self._take_profit_ratio)
             
         elif composite_signal['signal'] == 'SELL':
             # For sell signals
@@ -291,7 +378,7 @@ class SignalGenerator:
                 current_price + atr_stop_distance,
                 support_resistance['resistance'] * 1.01  # Just above resistance
             )
-            take_profit = current_price - (atr_stop_distance * self.config.TAKE_PROFIT_RATIO)
+            take_profit = current_price - (atr_stop_distance * self._take_profit_ratio)
             
         else:
             # For hold signals
@@ -303,13 +390,14 @@ class SignalGenerator:
         reward_amount = abs(take_profit - current_price)
         risk_reward_ratio = reward_amount / risk_amount if risk_amount > 0 else 0
         
+        # Unrounded; the CLI formats prices to cents when displaying them
         return {
-            'stop_loss': round(stop_loss, 2),
-            'take_profit': round(take_profit, 2),
-            'risk_amount': round(risk_amount, 2),
-            'reward_amount': round(reward_amount, 2),
-            'risk_reward_ratio': round(risk_reward_ratio, 2),
-            'atr_value': round(atr, 2)
+            'stop_loss': stop_loss,
+            'take_profit': take_profit,
+            'risk_amount': risk_amount,
+            'reward_amount': reward_amount,
+            'risk_reward_ratio': risk_reward_ratio,
+            'atr_value': atr
         }
     
     def _get_market_context(self, indicator_data: Dict) -> Dict[str, Any]:
@@ -348,11 +436,17 @@ class SignalGenerator:
         else:
             return f"HOLD - No clear trading opportunity (Score: {confidence:.1f}/10)"
     
-    def _create_error_signal(self, error_message: str) -> Dict[str, Any]:
+    def _create_error_signal(self, error_message: str) -> Signal:
         """Create error signal when analysis fails"""
-        return {
-            'signal': 'ERROR',
-            'error': error_message,
-            'timestamp': pd.Timestamp.now(),
-            'recommendation': 'Unable to generate signal due to data issues'
-        }
+        return Signal(
+            timestamp=datetime.now(),
+            current_price=0.0,
+            signal='ERROR',
+            signal_strength=0.0,
+            confidence=0.0,
+            components={},
+            risk_management={},
+            market_context={},
+            recommendation='Unable to generate signal due to data issues',
+            error=error_message
+        )
@@ -8,27 +8,35 @@ for Gold Futures (GC=F) using technical indicators like EMA and RSI.
 """
 
 import sys
-import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, Any, Optional
 import pandas as pd
 
-# Add src directory to path for imports
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from .config import CONFIG
+from .data_fetcher import DataFetcher
+from .signal_generator import SignalGenerator, Signal
+from .indicators import bars_from_frame
+from .cli import TradingBotCLI, terminal_colors, write_lines
 
-from config import Config
-from data_fetcher import DataFetcher
-from signal_generator import SignalGenerator
-from cli import TradingBotCLI
+@dataclass
+class AnalysisResult:
+    """Outcome of analyzing one timeframe: the signal, or the reason there is none"""
+    signal: Optional[Signal] = None
+    error: Optional[str] = None
 
 class GoldTradingBot:
     """Main Gold Trading Bot class"""
     
+    __slots__ = ('config', 'data_fetcher', 'cli', 'demo_mode', 'session_data', '_timeframe_generators', '_pool',
+                 '_colors', '_consensus_labels')
+    
     def __init__(self, demo_mode: bool = False):
         """Initialize the trading bot"""
-        self.config = Config()
+        self.config = CONFIG
         self.data_fetcher = DataFetcher(demo_mode=demo_mode)
-        self.signal_generator = SignalGenerator()
         self.cli = TradingBotCLI(demo_mode=demo_mode)
         self.demo_mode = demo_mode
         
@@ -37,10 +45,27 @@ class GoldTradingBot:
             'start_time': datetime.now(),
             'analyses_performed': 0,
             'signals_generated': [],
-            'last_analysis': None
+            'last_analysis': None,
+            'signal_counts': {'BUY': 0, 'SELL': 0, 'HOLD': 0}
+        }
+        
+        # One generator per timeframe for the whole session, so each keeps its own indicator state and
+        # signal cache: polling a timeframe whose last bar is unchanged returns the stored signal even
+        # after other timeframes were analyzed, and multi-timeframe signals can be generated concurrently
+        # (the numba kernels release the GIL)
+        self._timeframe_generators: Dict[str, SignalGenerator] = {}
+        self._pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix='goldbot-analysis')
+        
+        # Output is colored only on a terminal; redirected output and logs get plain text
+        self._colors = terminal_colors()
+        colors = self._colors
+        self._consensus_labels = {
+            'BUY': f"{colors['BUY']}BUY CONSENSUS{colors['RESET']}",
+            'SELL': f"{colors['SELL']}SELL CONSENSUS{colors['RESET']}",
+            'HOLD': f"{colors['HOLD']}MIXED/HOLD{colors['RESET']}"
         }
     
-    def run_single_analysis(self, timeframe: str = '1d', display_results: bool = True) -> Optional[Dict[str, Any]]:
+    def run_single_analysis(self, timeframe: str = '1d', display_results: bool = True) -> Optional[Signal]:
         """
         Run a single trading analysis
         
@@ -49,53 +74,95 @@ class GoldTradingBot:
             display_results: Whether to display results via CLI
             
         Returns:
-            Signal data dictionary or None if failed
+            Signal or None if failed
         """
+        if timeframe not in self.config.TIMEFRAME_MAPPING:
+            write_lines([f"🚀 Starting Gold Trading Analysis...", f"❌ Analysis failed: {timeframe!r}"])
+            return None
+        
+        write_lines([
+            f"🚀 Starting Gold Trading Analysis...",
+            f"📊 Timeframe: {self.config.TIMEFRAME_MAPPING[timeframe]['description']}",
+            f"⏰ Analysis Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        ])
+        
         try:
-            print(f"🚀 Starting Gold Trading Analysis...")
-            print(f"📊 Timeframe: {self.config.TIMEFRAME_MAPPING[timeframe]['description']}")
-            print(f"⏰ Analysis Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            
             # Fetch market data
             market_data = self.data_fetcher.get_market_data(timeframe)
-            
-            if market_data is None:
-                print("❌ Failed to fetch market data")
-                return None
-            
-            # Validate data quality
-            if not self.data_fetcher.validate_data(market_data):
-                print("❌ Data validation failed")
-                return None
-            
-            print(f"✅ Successfully fetched {len(market_data)} data points")
-            
-            # Generate trading signal
-            signal_data = self.signal_generator.generate_signal(market_data)
-            
-            if signal_data.get('signal') == 'ERROR':
-                print(f"❌ Signal generation failed: {signal_data.get('error')}")
-                return None
-            
-            # Update session data
-            self.session_data['analyses_performed'] += 1
-            self.session_data['signals_generated'].append({
-                'timestamp': signal_data['timestamp'],
-                'signal': signal_data['signal'],
-                'strength': signal_data['signal_strength'],
-                'confidence': signal_data['confidence']
-            })
-            self.session_data['last_analysis'] = signal_data
-            
-            # Display results if requested
-            if display_results:
-                self.cli.display_signal_analysis(signal_data)
-            
-            return signal_data
-            
         except Exception as e:
             print(f"❌ Analysis failed: {str(e)}")
             return None
+        
+        result = self._run_single_from_df(market_data, timeframe, display_results)
+        if result.error is not None:
+            print(f"❌ {result.error}")
+        return result.signal
+    
+    def _run_single_from_df(self, market_data: Optional[pd.DataFrame], timeframe: str,
+                            display_results: bool = True) -> AnalysisResult:
+        """
+        Analyze already fetched market data and record the signal in the session
+        
+        Args:
+            market_data: OHLCV data for the timeframe (None if fetching failed)
+            timeframe: Chart timeframe the data belongs to
+            display_results: Whether to display results via CLI
+            
+        Returns:
+            AnalysisResult with the signal, or the reason there is none
+        """
+        error = self._market_data_error(market_data)
+        if error is not None:
+            return AnalysisResult(error=error)
+        
+        # Generate trading signal from the column arrays, split off the frame once
+        signal_data = self._timeframe_generator(timeframe).generate_signal(bars_from_frame(market_data))
+        
+        return self._record_signal(signal_data, display_results)
+    
+    def _market_data_error(self, market_data: Optional[pd.DataFrame]) -> Optional[str]:
+        """Reason fetched market data cannot be analyzed, or None if it can"""
+        if market_data is None:
+            return "Failed to fetch market data"
+        
+        # Validate data quality
+        if not self.data_fetcher.validate_data(market_data):
+            return "Data validation failed"
+        
+        print(f"✅ Successfully fetched {len(market_data)} data points")
+        return None
+    
+    def _record_signal(self, signal_data: Signal, display_results: bool) -> AnalysisResult:
+        """Add a generated signal to the session (error signals are not recorded)"""
+        if signal_data.signal == 'ERROR':
+            return AnalysisResult(error=f"Signal generation failed: {signal_data.error}")
+        
+        # Update session data
+        self.session_data['analyses_performed'] += 1
+        self.session_data['signals_generated'].append({
+            'timestamp': signal_data.timestamp,
+            'signal': signal_data.signal,
+            'strength': signal_data.signal_strength,
+            'confidence': signal_data.confidence
+        })
+        self.session_data['last_analysis'] = signal_data
+        
+        signal_counts = self.session_data['signal_counts']
+        if signal_data.signal in signal_counts:
+            signal_counts[signal_data.signal] += 1
+        
+        # Display results if requested
+        if display_results:
+            self.cli.display_signal_analysis(signal_data)
+        
+        return AnalysisResult(signal=signal_data)
+    
+    def _timeframe_generator(self, timeframe: str) -> SignalGenerator:
+        """Get the session's signal generator for a timeframe, creating it on first use"""
+        generator = self._timeframe_generators.get(timeframe)
+        if generator is None:
+            generator = self._timeframe_generators[timeframe] = SignalGenerator()
+        return generator
     
     def run_multi_timeframe_analysis(self) -> Dict[str, Any]:
         """
@@ -104,16 +171,39 @@ class GoldTradingBot:
         Returns:
             Dictionary with results from all timeframes
         """
-        print(f"\n🔍 Running Multi-Timeframe Analysis...")
-        print(f"{'='*60}")
+        write_lines([f"\n🔍 Running Multi-Timeframe Analysis...", f"{'='*60}"])
         
         results = {}
         timeframes = ['1d', '2d', '5d']
         
+        # One fetch of the finest candles, resampled for every timeframe
+        try:
+            market_data = self.data_fetcher.get_multi_timeframe_data(timeframes)
+        except Exception as e:
+            print(f"❌ Analysis failed: {str(e)}")
+            market_data = {}
+        
+        # Validate every timeframe, then generate their signals concurrently
+        pending = {}
         for timeframe in timeframes:
             print(f"\n📊 Analyzing {self.config.TIMEFRAME_MAPPING[timeframe]['description']}...")
-            result = self.run_single_analysis(timeframe, display_results=False)
-            results[timeframe] = result
+            error = self._market_data_error(market_data.get(timeframe))
+            if error is not None:
+                print(f"❌ {error}")
+                continue
+            
+            bars = bars_from_frame(market_data[timeframe])
+            pending[timeframe] = self._pool.submit(self._timeframe_generator(timeframe).generate_signal, bars)
+        
+        for timeframe in timeframes:
+            results[timeframe] = None
+            if timeframe not in pending:
+                continue
+            
+            result = self._record_signal(pending[timeframe].result(), display_results=False)
+            if result.error is not None:
+                print(f"❌ {result.error}")
+            results[timeframe] = result.signal
         
         # Display consolidated results
         self._display_multi_timeframe_results(results)
@@ -186,48 +276,52 @@ class GoldTradingBot:
     
     def _display_multi_timeframe_results(self, results: Dict[str, Any]) -> None:
         """Display consolidated multi-timeframe results"""
-        print(f"\n{self.config.COLORS['INFO']}📊 MULTI-TIMEFRAME ANALYSIS SUMMARY{self.config.COLORS['RESET']}")
-        print(f"{'='*60}")
+        lines = [
+            f"\n{self._colors['INFO']}📊 MULTI-TIMEFRAME ANALYSIS SUMMARY{self._colors['RESET']}",
+            f"{'='*60}"
+        ]
         
         # Create summary table
         summary_data = []
         for timeframe, result in results.items():
-            if result and result.get('signal') != 'ERROR':
+            if result and result.signal != 'ERROR':
                 summary_data.append({
                     'Timeframe': self.config.TIMEFRAME_MAPPING[timeframe]['description'],
-                    'Signal': result['signal'],
-                    'Strength': f"{result['signal_strength']:.1f}/10",
-                    'Confidence': f"{result['confidence']:.1f}/10",
-                    'Price': f"${result['current_price']:.2f}"
+                    'Signal': result.signal,
+                    'Strength': f"{result.signal_strength:.1f}/10",
+                    'Confidence': f"{result.confidence:.1f}/10",
+                    'Price': f"${result.current_price:.2f}"
                 })
         
         if summary_data:
             # Display table
-            print(f"\n{'Timeframe':<25} {'Signal':<8} {'Strength':<10} {'Confidence':<12} {'Price':<10}")
-            print(f"{'-'*70}")
+            lines.append(f"\n{'Timeframe':<25} {'Signal':<8} {'Strength':<10} {'Confidence':<12} {'Price':<10}")
+            lines.append(f"{'-'*70}")
             
             for row in summary_data:
-                signal_color = self.config.COLORS['BUY'] if row['Signal'] == 'BUY' else \
-                              self.config.COLORS['SELL'] if row['Signal'] == 'SELL' else \
-                              self.config.COLORS['HOLD']
+                signal_color = self._colors['BUY'] if row['Signal'] == 'BUY' else \
+                              self._colors['SELL'] if row['Signal'] == 'SELL' else \
+                              self._colors['HOLD']
                 
-                print(f"{row['Timeframe']:<25} {signal_color}{row['Signal']:<8}{self.config.COLORS['RESET']} "
-                      f"{row['Strength']:<10} {row['Confidence']:<12} {row['Price']:<10}")
+                lines.append(f"{row['Timeframe']:<25} {signal_color}{row['Signal']:<8}{self._colors['RESET']} "
+                             f"{row['Strength']:<10} {row['Confidence']:<12} {row['Price']:<10}")
             
             # Consensus analysis
             signals = [row['Signal'] for row in summary_data]
             consensus = self._calculate_consensus(signals)
-            print(f"\n🎯 Consensus Signal: {consensus}")
+            lines.append(f"\n🎯 Consensus Signal: {consensus}")
         else:
-            print("❌ No valid results to display")
+            lines.append("❌ No valid results to display")
+        
+        write_lines(lines)
     
-    def _calculate_basic_metrics(self, result: Dict[str, Any]) -> Dict[str, Any]:
+    def _calculate_basic_metrics(self, result: Signal) -> Dict[str, Any]:
         """Calculate basic performance metrics"""
-        risk_mgmt = result.get('risk_management', {})
+        risk_mgmt = result.risk_management
         
         return {
-            'signal_strength': result.get('signal_strength', 0),
-            'confidence_score': result.get('confidence', 0),
+            'signal_strength': result.signal_strength,
+            'confidence_score': result.confidence,
             'risk_reward_ratio': risk_mgmt.get('risk_reward_ratio', 0),
             'potential_risk': risk_mgmt.get('risk_amount', 0),
             'potential_reward': risk_mgmt.get('reward_amount', 0)
@@ -235,69 +329,70 @@ class GoldTradingBot:
     
     def _get_signal_distribution(self) -> Dict[str, int]:
         """Get distribution of signals generated in this session"""
-        distribution = {'BUY': 0, 'SELL': 0, 'HOLD': 0}
-        
-        for signal_record in self.session_data['signals_generated']:
-            signal = signal_record['signal']
-            if signal in distribution:
-                distribution[signal] += 1
-        
-        return distribution
+        # Counted as signals are recorded, so this does not rescan the session
+        return dict(self.session_data['signal_counts'])
     
     def _calculate_consensus(self, signals: list) -> str:
         """Calculate consensus from multiple signals"""
         if not signals:
             return "NO DATA"
         
-        buy_count = signals.count('BUY')
-        sell_count = signals.count('SELL')
-        hold_count = signals.count('HOLD')
+        counts = Counter(signals)
+        buy_count = counts['BUY']
+        sell_count = counts['SELL']
+        hold_count = counts['HOLD']
         
         if buy_count > sell_count and buy_count > hold_count:
-            return f"{self.config.COLORS['BUY']}BUY CONSENSUS{self.config.COLORS['RESET']} ({buy_count}/{len(signals)})"
+            return f"{self._consensus_labels['BUY']} ({buy_count}/{len(signals)})"
         elif sell_count > buy_count and sell_count > hold_count:
-            return f"{self.config.COLORS['SELL']}SELL CONSENSUS{self.config.COLORS['RESET']} ({sell_count}/{len(signals)})"
+            return f"{self._consensus_labels['SELL']} ({sell_count}/{len(signals)})"
         else:
-            return f"{self.config.COLORS['HOLD']}MIXED/HOLD{self.config.COLORS['RESET']}"
+            return self._consensus_labels['HOLD']
     
     def display_system_info(self) -> None:
         """Display system information and configuration"""
-        print(f"\n{self.config.COLORS['INFO']}🔧 SYSTEM INFORMATION{self.config.COLORS['RESET']}")
-        print(f"{'='*50}")
-        print(f"📊 Default Symbol: {self.config.DEFAULT_SYMBOL}")
-        print(f"🔑 Alpha Vantage API: {'✅ Active' if self.config.ALPHA_VANTAGE_API_KEY else '❌ Not configured'}")
-        print(f"📈 EMA Periods: {self.config.EMA_SHORT_PERIOD}, {self.config.EMA_LONG_PERIOD}")
-        print(f"📊 RSI Settings: {self.config.RSI_PERIOD} period, {self.config.RSI_OVERSOLD}-{self.config.RSI_OVERBOUGHT} levels")
-        print(f"🎯 Risk Management: {self.config.DEFAULT_RISK_PERCENT}% risk, {self.config.STOP_LOSS_ATR_MULTIPLIER}x ATR stop")
-        print(f"🔄 Trading Mode: {self.config.TRADING_MODE}")
-        
         # Session info
         session = self.get_session_summary()
-        print(f"\n📊 Session Statistics:")
-        print(f"   ⏰ Runtime: {session['runtime_minutes']:.1f} minutes")
-        print(f"   🔍 Analyses: {session['analyses_performed']}")
-        print(f"   📈 Signals: {session['total_signals']}")
+        
+        write_lines([
+            f"\n{self._colors['INFO']}🔧 SYSTEM INFORMATION{self._colors['RESET']}",
+            f"{'='*50}",
+            f"📊 Default Symbol: {self.config.DEFAULT_SYMBOL}",
+            f"🔑 Alpha Vantage API: {'✅ Active' if self.config.ALPHA_VANTAGE_API_KEY else '❌ Not configured'}",
+            f"📈 EMA Periods: {self.config.EMA_SHORT_PERIOD}, {self.config.EMA_LONG_PERIOD}",
+            f"📊 RSI Settings: {self.config.RSI_PERIOD} period, {self.config.RSI_OVERSOLD}-{self.config.RSI_OVERBOUGHT} levels",
+            f"🎯 Risk Management: {self.config.DEFAULT_RISK_PERCENT}% risk, {self.config.STOP_LOSS_ATR_MULTIPLIER}x ATR stop",
+            f"🔄 Trading Mode: {self.config.TRADING_MODE}",
+            f"\n📊 Session Statistics:",
+            f"   ⏰ Runtime: {session['runtime_minutes']:.1f} minutes",
+            f"   🔍 Analyses: {session['analyses_performed']}",
+            f"   📈 Signals: {session['total_signals']}"
+        ])
     
     def run_interactive_mode(self) -> None:
         """Run the bot in interactive CLI mode"""
         try:
             self.cli.run()
         except KeyboardInterrupt:
-            print(f"\n{self.config.COLORS['INFO']}👋 Session ended by user{self.config.COLORS['RESET']}")
+            print(f"\n{self._colors['INFO']}👋 Session ended by user{self._colors['RESET']}")
         except Exception as e:
-            print(f"\n{self.config.COLORS['SELL']}❌ Unexpected error: {str(e)}{self.config.COLORS['RESET']}")
+            print(f"\n{self._colors['SELL']}❌ Unexpected error: {str(e)}{self._colors['RESET']}")
         finally:
             # Display session summary
             session = self.get_session_summary()
             if session['analyses_performed'] > 0:
-                print(f"\n{self.config.COLORS['INFO']}📊 SESSION SUMMARY{self.config.COLORS['RESET']}")
-                print(f"   Runtime: {session['runtime_minutes']:.1f} minutes")
-                print(f"   Analyses performed: {session['analyses_performed']}")
-                print(f"   Signals generated: {session['total_signals']}")
+                lines = [
+                    f"\n{self._colors['INFO']}📊 SESSION SUMMARY{self._colors['RESET']}",
+                    f"   Runtime: {session['runtime_minutes']:.1f} minutes",
+                    f"   Analyses performed: {session['analyses_performed']}",
+                    f"   Signals generated: {session['total_signals']}"
+                ]
                 
                 if session['signal_distribution']:
                     dist = session['signal_distribution']
-                    print(f"   Signal distribution: BUY({dist['BUY']}) SELL({dist['SELL']}) HOLD({dist['HOLD']})")
+                    lines.append(f"   Signal distribution: BUY({dist['BUY']}) SELL({dist['SELL']}) HOLD({dist['HOLD']})")
+                
+                write_lines(lines)
 
 def main():
     """Main entry point"""